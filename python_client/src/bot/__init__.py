@@ -0,0 +1,4 @@
+from .evaluation import (Evaluation, MaterialEvaluation)
+from .search import (Searcher, SearchResult, SearchTimeout, WIN_SCORE)
+
+__all__ = ['Evaluation', 'MaterialEvaluation', 'Searcher', 'SearchResult', 'SearchTimeout', 'WIN_SCORE']
@@ -0,0 +1,33 @@
+from typing import Protocol
+from model import GameState, PieceType
+
+class Evaluation(Protocol):
+    def evaluate(self, state: GameState) -> float:
+        ...
+
+class MaterialEvaluation(Evaluation):
+    def __init__(self, values: dict[PieceType, float] | None = None, hand_weight: float = 0.8):
+        self._values = values if values is not None else {
+            PieceType.chick: 1.0,
+            PieceType.elephant: 3.0,
+            PieceType.giraffe: 3.0,
+            PieceType.monkey: 5.0,
+            PieceType.lion: 0.0
+        }
+        self._hand_weight = hand_weight
+
+    def evaluate(self, state: GameState) -> float:
+        score = 0.0
+
+        for row in state.board_status:
+            for piece in row:
+                if piece is not None:
+                    value = self._values[piece.get_piece_type]
+                    score += value if piece.get_player is state.turn else -value
+
+        for captured in (state.P1_captured, state.P2_captured):
+            for piece in captured:
+                value = self._values[piece.get_piece_type] * self._hand_weight
+                score += value if piece.get_player is state.turn else -value
+
+        return score
@@ -0,0 +1,202 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from time import perf_counter
+from model import (
+    Action, ActionType, Bound, GameStatus, Model, TranspositionTable
+)
+from .evaluation import Evaluation, MaterialEvaluation
+
+WIN_SCORE = 1_000_000.0
+
+class SearchTimeout(Exception):
+    pass
+
+@dataclass(frozen = True)
+class SearchResult:
+    action: Action | None
+    value: float
+    depth: int
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+class Searcher:
+    def __init__(
+        self,
+        evaluation: Evaluation | None = None,
+        time_budget: float = 1.0,
+        max_depth: int = 64,
+        table: TranspositionTable | None = None,
+        check_interval: int = 1024
+    ):
+        if time_budget <= 0:
+            raise ValueError('time_budget must be positive')
+
+        if max_depth <= 0:
+            raise ValueError('max_depth must be positive')
+
+        self._evaluation = evaluation if evaluation is not None else MaterialEvaluation()
+        self._time_budget = time_budget
+        self._max_depth = max_depth
+        self._mate_threshold = WIN_SCORE - max_depth
+        self._table = table if table is not None else TranspositionTable()
+        self._check_interval = check_interval
+        self._nodes = 0
+        self._deadline = 0.0
+
+    def search(self, model: Model) -> SearchResult:
+        start = perf_counter()
+        self._deadline = start + self._time_budget
+        self._nodes = 0
+        model = model.fork(self._max_depth)
+
+        best_action = next(model.legal_actions(), None)
+        best_value = 0.0
+        completed = 0
+
+        if best_action is not None:
+            for depth in range(1, self._max_depth + 1):
+                try:
+                    value, action = self._root(model, depth)
+                except SearchTimeout:
+                    break
+
+                completed = depth
+                best_value = value
+                if action is not None:
+                    best_action = action
+
+                if abs(value) >= self._mate_threshold:
+                    break
+
+        return SearchResult(best_action, best_value, completed, self._nodes, perf_counter() - start)
+
+    def _root(self, model: Model, depth: int) -> tuple[float, Action | None]:
+        entry = self._table.probe(model.position_hash)
+        best_value = -float('inf')
+        best_action: Action | None = None
+        alpha = -float('inf')
+        beta = float('inf')
+
+        for action in self._ordered(model, entry.action if entry is not None else None):
+            value = self._child(model, action, depth, alpha, beta, 0)
+            if value > best_value:
+                best_value = value
+                best_action = action
+            alpha = max(alpha, value)
+
+        self._table.store(model.position_hash, depth, best_value, Bound.exact, best_action)
+        return best_value, best_action
+
+    def _child(self, model: Model, action: Action, depth: int, alpha: float, beta: float, ply: int) -> float:
+        turn = model.state.turn
+        model.make(action)
+
+        try:
+            if model.state.turn is turn:
+                return self._negamax(model, depth - 1, alpha, beta, ply + 1)
+
+            return -self._negamax(model, depth - 1, -beta, -alpha, ply + 1)
+        finally:
+            model.unmake()
+
+    def _negamax(self, model: Model, depth: int, alpha: float, beta: float, ply: int) -> float:
+        self._nodes += 1
+        if self._nodes % self._check_interval == 0 and perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        state = model.state
+        if state.game_status is GameStatus.has_winner:
+            return WIN_SCORE - ply
+
+        if state.game_status is GameStatus.draw:
+            return 0.0
+
+        if depth <= 0:
+            return self._evaluation.evaluate(state)
+
+        key = model.position_hash
+        original_alpha = alpha
+        entry = self._table.probe(key)
+        if entry is not None and entry.depth >= depth:
+            value = self._from_table(entry.value, ply)
+            if entry.bound is Bound.exact:
+                return value
+
+            if entry.bound is Bound.lower:
+                alpha = max(alpha, value)
+            elif entry.bound is Bound.upper:
+                beta = min(beta, value)
+
+            if alpha >= beta:
+                return value
+
+        best_value = -float('inf')
+        best_action: Action | None = None
+
+        for action in self._ordered(model, entry.action if entry is not None else None):
+            value = self._child(model, action, depth, alpha, beta, ply)
+            if value > best_value:
+                best_value = value
+                best_action = action
+
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_action is None:
+            return self._evaluation.evaluate(state)
+
+        if best_value <= original_alpha:
+            bound = Bound.upper
+        elif best_value >= beta:
+            bound = Bound.lower
+        else:
+            bound = Bound.exact
+
+        self._table.store(key, depth, self._to_table(best_value, ply), bound, best_action)
+        return best_value
+
+    def _to_table(self, value: float, ply: int) -> float:
+        if value >= self._mate_threshold:
+            return value + ply
+
+        if value <= -self._mate_threshold:
+            return value - ply
+
+        return value
+
+    def _from_table(self, value: float, ply: int) -> float:
+        if value >= self._mate_threshold:
+            return value - ply
+
+        if value <= -self._mate_threshold:
+            return value + ply
+
+        return value
+
+    def _ordered(self, model: Model, hint: Action | None) -> list[Action]:
+        first: list[Action] = []
+        captures: list[Action] = []
+        quiet: list[Action] = []
+
+        for action in model.legal_actions():
+            if action == hint:
+                first.append(action)
+            elif action.action_type is ActionType.move and model.piece_at(action.target) is not None:
+                captures.append(action)
+            else:
+                quiet.append(action)
+
+        return first + captures + quiet
+
+    @property
+    def get_table(self) -> TranspositionTable:
+        return self._table
+
+    @property
+    def get_nodes(self) -> int:
+        return self._nodes
@@ -1,3 +1,4 @@
 from .controller import Controller
+from .bot_player import BotPlayer
 
-__all__ = ['Controller']
\ No newline at end of file
+__all__ = ['Controller', 'BotPlayer']
\ No newline at end of file
@@ -0,0 +1,108 @@
+import queue
+import threading
+from collections.abc import Callable
+from model import (Action, ActionType, GameState, GameStatus, Model, Player)
+from view.observers import (DropObserver, MoveObserver, PieceSelectObserver)
+from bot import Searcher, SearchResult
+
+class BotPlayer:
+    def __init__(self, model: Model, searcher: Searcher, player: Player, on_ready: Callable[[], object] | None = None):
+        self._model = model
+        self._searcher = searcher
+        self._player = player
+        self._on_ready = on_ready
+        self._results: queue.Queue[tuple[int, SearchResult]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._searched_version = -1
+        self._applying = False
+
+        self._piece_select_observers: list[PieceSelectObserver] = []
+        self._move_observers: list[MoveObserver] = []
+        self._drop_observers: list[DropObserver] = []
+
+    def on_state_change(self, state: GameState):
+        if self._applying or self.is_thinking or state.version == self._searched_version or not self._is_bot_turn(state):
+            return
+
+        self._searched_version = state.version
+        model = self._model.fork(1)
+        self._thread = threading.Thread(target = self._search, args = (state.version, model), name = 'bot-search', daemon = True)
+        self._thread.start()
+
+    def on_wake(self):
+        self.poll()
+
+    def poll(self) -> bool:
+        try:
+            version, result = self._results.get_nowait()
+        except queue.Empty:
+            return False
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        played = False
+        if version == self._model.state.version and result.action is not None:
+            self._applying = True
+            try:
+                played = self._play(result.action)
+            finally:
+                self._applying = False
+
+        self.on_state_change(self._model.state)
+        return played
+
+    def wait(self, timeout: float | None = None) -> bool:
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return not self._results.empty()
+
+    def _search(self, version: int, model: Model):
+        self._results.put((version, self._searcher.search(model)))
+        if self._on_ready is not None:
+            self._on_ready()
+
+    def _is_bot_turn(self, state: GameState) -> bool:
+        return state.game_status is GameStatus.ongoing and state.turn is self._player
+
+    def _play(self, action: Action) -> bool:
+        state = self._model.state
+        if action.action_type is ActionType.move and action.source is not None:
+            piece = self._model.piece_at(action.source)
+        else:
+            captured = state.P1_captured if self._player is Player.p1 else state.P2_captured
+            piece = next((piece for piece in captured if piece.get_piece_type is action.piece_type), None)
+
+        if piece is None:
+            return False
+
+        for observer in self._piece_select_observers:
+            observer.on_piece_select(piece, self._player)
+
+        if action.action_type is ActionType.move:
+            for observer in self._move_observers:
+                observer.on_move(action.target, self._player)
+        else:
+            for observer in self._drop_observers:
+                observer.on_drop(action.target, self._player)
+
+        return True
+
+    def register_piece_select_observer(self, observer: PieceSelectObserver):
+        self._piece_select_observers.append(observer)
+
+    def register_move_observer(self, observer: MoveObserver):
+        self._move_observers.append(observer)
+
+    def register_drop_observer(self, observer: DropObserver):
+        self._drop_observers.append(observer)
+
+    @property
+    def is_thinking(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def get_player(self) -> Player:
+        return self._player
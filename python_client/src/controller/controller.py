@@ -1,7 +1,8 @@
 from model import Model
 from view import View
-from model import (GameState, Location, Player, Piece)
-from view import (GameStateChangeObserver, View)
+from model import (GameState, Location, Player, Piece, Savepoint)
+from view import (GameStateChangeObserver, LegalActionsChangeObserver, View)
+from .bot_player import BotPlayer
 
 class Controller:
     def __init__(self, model: Model, view: View):
@@ -9,17 +10,24 @@ class Controller:
         self._view = view
 
         self._game_state_change_observers: list[GameStateChangeObserver] = []
+        self._legal_actions_change_observers: list[LegalActionsChangeObserver] = []
+        self._savepoint: Savepoint | None = None
+        self._notified_version = -1
+        self._notified_position_version = -1
 
     def start(self):
         view = self._view
         
         self.register_game_state_change_observer(view)
+        self.register_legal_actions_change_observer(view)
         view.register_new_game_observer(self)
         view.register_piece_select_observer(self)
         view.register_move_observer(self)
         view.register_drop_observer(self)
         view.register_undo_observer(self)
+        view.register_prediction_observer(self)
 
+        self._on_state_change(self._model.state)
         view.run()
 
     def on_new_game(self):
@@ -42,9 +50,44 @@ class Controller:
         self._model.undo(player)
         self._on_state_change(self._model.state)
     
+    def on_prediction_start(self):
+        self._savepoint = self._model.savepoint()
+
+    def on_prediction_settled(self):
+        self._savepoint = None
+
+    def on_prediction_rollback(self):
+        if self._savepoint is not None:
+            self._model.rollback(self._savepoint)
+            self._savepoint = None
+            self._on_state_change(self._model.state)
+
+    def register_bot_player(self, bot_player: BotPlayer):
+        self.register_game_state_change_observer(bot_player)
+        self._view.register_wake_observer(bot_player)
+        bot_player.register_piece_select_observer(self)
+        bot_player.register_move_observer(self)
+        bot_player.register_drop_observer(self)
+
     def register_game_state_change_observer(self, observer: GameStateChangeObserver):
         self._game_state_change_observers.append(observer)
+
+    def register_legal_actions_change_observer(self, observer: LegalActionsChangeObserver):
+        self._legal_actions_change_observers.append(observer)
     
     def _on_state_change(self, state: GameState):
+        if state.version == self._notified_version:
+            return
+
+        self._notified_version = state.version
         for observer in self._game_state_change_observers:
-            observer.on_state_change(state)
\ No newline at end of file
+            if self._notified_version != state.version:
+                return
+            observer.on_state_change(state)
+
+        position_version = self._model.position_version
+        if self._legal_actions_change_observers and position_version != self._notified_position_version:
+            self._notified_position_version = position_version
+            legal_actions = list(self._model.legal_actions())
+            for observer in self._legal_actions_change_observers:
+                observer.on_legal_actions_change(legal_actions)
\ No newline at end of file
@@ -0,0 +1,182 @@
+from __future__ import annotations
+import argparse
+import asyncio
+import random
+import statistics
+from dataclasses import dataclass, field, replace
+from time import perf_counter
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed, InvalidHandshake
+from model import (ActionType, GameStatus, Player)
+from network import (InboundQueue, MessageCodec, Message, Opcode, ProtocolError, select_message)
+from server import (GameServer, Match)
+
+@dataclass
+class LoadStats:
+    latencies: list[float] = field(default_factory = list)
+    accepted: int = 0
+    rejected: int = 0
+    games: int = 0
+
+class SimulatedClient:
+    def __init__(self, url: str, seed: int, max_actions: int, stats: LoadStats):
+        self._url = url
+        self._rng = random.Random(seed)
+        self._max_actions = max_actions
+        self._stats = stats
+        self._codec = MessageCodec(8, 8)
+        self._mirror = Match(0)
+        self._inbound = InboundQueue()
+        self._in_flight: dict[int, float] = {}
+        self._sequence = 0
+        self._actions = 0
+
+    async def run(self):
+        try:
+            connection = await connect(self._url, compression = None)
+        except InvalidHandshake as error:
+            raise ConnectionRefusedError(f'{self._url} refused a client: {error}') from error
+
+        async with connection:
+            try:
+                greeting = await connection.recv()
+            except ConnectionClosed as error:
+                raise ConnectionRefusedError(f'{self._url} closed a client before assigning it a player') from error
+            self._player = Player.p1 if str(greeting).split(' ', 1)[0] == '1' else Player.p2
+
+            try:
+                await self._act(connection)
+                async for frame in connection:
+                    self._receive(str(frame))
+                    if self._actions >= self._max_actions and not self._in_flight:
+                        return
+                    await self._act(connection)
+            except ConnectionClosed:
+                pass
+
+    def _receive(self, frame: str):
+        _, payload = frame.split(' ', 1)
+        try:
+            message = self._codec.decode_text(payload)
+        except ProtocolError:
+            return
+
+        for ready in self._inbound.push(message):
+            if ready.player is self._player and ready.sequence in self._in_flight:
+                self._stats.latencies.append(perf_counter() - self._in_flight.pop(ready.sequence))
+                if ready.opcode is Opcode.reject:
+                    self._stats.rejected += 1
+                else:
+                    self._stats.accepted += 1
+
+            if ready.opcode is Opcode.new_game and ready.player is self._player:
+                self._stats.games += 1
+            self._mirror.apply(ready.player, self._codec.encode_text(ready))
+
+    async def _send(self, connection: ClientConnection, message: Message):
+        message = replace(message, sequence = self._sequence)
+        self._in_flight[self._sequence] = perf_counter()
+        self._sequence += 1
+        await connection.send(self._codec.encode_text(message))
+
+    async def _act(self, connection: ClientConnection):
+        if self._in_flight or self._actions >= self._max_actions:
+            return
+
+        model = self._mirror.get_model
+        state = model.state
+        if state.game_status is not GameStatus.ongoing:
+            if self._player is Player.p1:
+                self._actions += 1
+                await self._send(connection, Message(Opcode.new_game, self._player))
+            return
+
+        if state.turn is not self._player:
+            return
+
+        legal_actions = list(model.legal_actions())
+        if not legal_actions:
+            return
+
+        action = self._rng.choice(legal_actions)
+        if action.action_type is ActionType.move and action.source is not None:
+            piece = model.piece_at(action.source)
+        else:
+            captured = state.P1_captured if self._player is Player.p1 else state.P2_captured
+            piece = next((piece for piece in captured if piece.get_piece_type is action.piece_type), None)
+
+        if piece is None:
+            return
+
+        opcode = Opcode.move if action.action_type is ActionType.move else Opcode.drop
+        self._actions += 1
+        await self._send(connection, select_message(piece, self._player))
+        await self._send(connection, Message(opcode, self._player, target = action.target))
+
+def _percentile(samples: list[float], percent: int) -> float:
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+
+    return statistics.quantiles(samples, n = 100, method = 'inclusive')[percent - 1]
+
+async def run_load(pairs: int, actions: int, port: int | None, seed: int) -> tuple[LoadStats, float]:
+    server: GameServer | None = None
+    server_task: asyncio.Task[None] | None = None
+
+    if port is None:
+        server = GameServer('127.0.0.1', 0)
+        server_task = asyncio.create_task(server.serve_forever())
+        port = await server.wait_started()
+
+    url = f'ws://127.0.0.1:{port}'
+    stats = LoadStats()
+    start = perf_counter()
+
+    try:
+        clients: list[SimulatedClient] = []
+        for index in range(pairs * 2):
+            clients.append(SimulatedClient(url, seed + index, actions, stats))
+
+        tasks: list[asyncio.Task[None]] = []
+        for client in clients:
+            tasks.append(asyncio.create_task(client.run()))
+            await asyncio.sleep(0)
+
+        await asyncio.gather(*tasks)
+    finally:
+        if server is not None and server_task is not None:
+            server.close()
+            await server_task
+
+    return stats, perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(
+        description = 'Drive simulated client pairs against a localhost Chogi server. '
+        'An external server given with --port must be serve.py\'s GameServer: the Go relay admits only two clients '
+        'and never closes a match, so it cannot host a load test.'
+    )
+    parser.add_argument('-n', '--pairs', type = int, default = 50)
+    parser.add_argument('--actions', type = int, default = 100, help = 'turn actions each client sends before disconnecting')
+    parser.add_argument('--port', type = int, default = None, help = 'port of a serve.py GameServer already running on localhost; by default one is started in-process')
+    parser.add_argument('--seed', type = int, default = 0)
+    args = parser.parse_args()
+
+    try:
+        stats, elapsed = asyncio.run(run_load(args.pairs, args.actions, args.port, args.seed))
+    except OSError as error:
+        parser.exit(1, f'loadtest: {error}\nloadtest: --port must point at a serve.py GameServer; the Go relay admits only two clients\n')
+
+    latencies = [latency * 1000 for latency in stats.latencies]
+
+    print(f'client pairs:   {args.pairs}')
+    print(f'elapsed:        {elapsed:.2f}s')
+    print(f'messages:       {stats.accepted} accepted, {stats.rejected} rejected')
+    print(f'games started:  {stats.games}')
+    print(f'throughput:     {(stats.accepted + stats.rejected) / elapsed:.0f} messages/sec')
+    print(f'rtt p50:        {_percentile(latencies, 50):.2f} ms')
+    print(f'rtt p95:        {_percentile(latencies, 95):.2f} ms')
+    print(f'rtt p99:        {_percentile(latencies, 99):.2f} ms')
+
+if __name__ == '__main__':
+    main()
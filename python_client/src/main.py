@@ -1,10 +1,19 @@
-from model import (Model, ChogiBoard, ChogiPieceInfo)
-from view import PygameView
-from controller import Controller
-
-if __name__ == '__main__':
-    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
-    view = PygameView(model.state)
-
-    controller = Controller(model, view)
-    controller.start()
\ No newline at end of file
+import argparse
+from model import (Model, ChogiBoard, ChogiPieceInfo, Player)
+from view import PygameView
+from controller import BotPlayer, Controller
+from bot import Searcher
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Play Chogi over the network, or locally against the computer.')
+    parser.add_argument('--bot', action = 'store_true', help = 'play offline as player 1 against a search bot')
+    parser.add_argument('--think', type = float, default = 1.0, help = 'bot time budget per action in seconds')
+    args = parser.parse_args()
+
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    view = PygameView(model.state, networked = not args.bot)
+
+    controller = Controller(model, view)
+    if args.bot:
+        controller.register_bot_player(BotPlayer(model, Searcher(time_budget = args.think), Player.p2, view.wake))
+    controller.start()
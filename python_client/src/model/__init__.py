@@ -1,4 +1,5 @@
-from .model import Model
-from .project_types import (GameState, GameStatus, Player, Location, Piece, PieceType, Trait, ChogiBoard, ChogiPieceInfo)
+from .model import (Model, Savepoint)
+from .transposition import (TranspositionTable, TableEntry, Bound, Replacement)
+from .project_types import (GameState, GameStatus, Player, Location, Piece, PieceType, Trait, Action, ActionType, BoardStatus, ChogiBoard, ChogiPieceInfo)
 
-__all__ = ['Model', 'GameState', 'GameStatus', 'Player', 'Location', 'Piece', 'PieceType', 'Trait', 'ChogiBoard', 'ChogiPieceInfo']
\ No newline at end of file
+__all__ = ['Model', 'Savepoint', 'GameState', 'GameStatus', 'Player', 'Location', 'Piece', 'PieceType', 'Trait', 'Action', 'ActionType', 'BoardStatus', 'ChogiBoard', 'ChogiPieceInfo', 'TranspositionTable', 'TableEntry', 'Bound', 'Replacement']
\ No newline at end of file
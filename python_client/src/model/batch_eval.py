@@ -0,0 +1,112 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from dataclasses import dataclass
+import numpy as np
+from numpy.typing import NDArray
+from .project_types import (
+    CHOGI_MOVES, GameState, Moves, PieceType, Player, Trait
+)
+
+PIECE_CODES: dict[PieceType, int] = {piece_type: index + 1 for index, piece_type in enumerate(PieceType)}
+PLAYER_INDEX: dict[Player, int] = {player: index for index, player in enumerate(Player)}
+
+@dataclass(frozen = True)
+class PackedBoards:
+    pieces: NDArray[np.int8]
+    protected: NDArray[np.bool_]
+    hands: NDArray[np.int16]
+
+    def __len__(self) -> int:
+        return len(self.pieces)
+
+@dataclass(frozen = True)
+class BatchFeatures:
+    mobility: NDArray[np.int32]
+    lion_trapped: NDArray[np.bool_]
+    drop_squares: NDArray[np.int32]
+
+def pack_states(states: Sequence[GameState]) -> PackedBoards:
+    if not states:
+        raise ValueError('states must not be empty')
+
+    row = len(states[0].board_status)
+    col = len(states[0].board_status[0])
+    pieces = np.zeros((len(states), row, col), dtype = np.int8)
+    protected = np.zeros((len(states), row, col), dtype = np.bool_)
+    hands = np.zeros((len(states), len(Player)), dtype = np.int16)
+
+    for index, state in enumerate(states):
+        if len(state.board_status) != row or any(len(board_row) != col for board_row in state.board_status):
+            raise ValueError('all states must share the same board size')
+
+        for i, board_row in enumerate(state.board_status):
+            for j, piece in enumerate(board_row):
+                if piece is not None:
+                    code = PIECE_CODES[piece.get_piece_type]
+                    pieces[index, i, j] = code if piece.get_player is Player.p1 else -code
+                    protected[index, i, j] = Trait.protected in piece.get_traits
+
+        hands[index, PLAYER_INDEX[Player.p1]] = len(state.P1_captured)
+        hands[index, PLAYER_INDEX[Player.p2]] = len(state.P2_captured)
+
+    return PackedBoards(pieces, protected, hands)
+
+def _shift(mask: NDArray[np.bool_], delta_row: int, delta_col: int) -> NDArray[np.bool_]:
+    _, row, col = mask.shape
+    shifted = np.zeros_like(mask)
+    if abs(delta_row) >= row or abs(delta_col) >= col:
+        return shifted
+
+    shifted[:, max(delta_row, 0):row + min(delta_row, 0), max(delta_col, 0):col + min(delta_col, 0)] = \
+        mask[:, max(-delta_row, 0):row + min(-delta_row, 0), max(-delta_col, 0):col + min(-delta_col, 0)]
+    return shifted
+
+def _attack_counts(packed: PackedBoards, player: Player, protected: bool, moves: dict[PieceType, Moves]) -> NDArray[np.int32]:
+    sign = 1 if player is Player.p1 else -1
+    counts = np.zeros(packed.pieces.shape, dtype = np.int32)
+
+    for piece_type, piece_moves in moves.items():
+        mask = (packed.pieces == sign * PIECE_CODES[piece_type]) & (packed.protected == protected)
+        if not mask.any():
+            continue
+
+        for delta_x, delta_y in piece_moves.get_moves(player):
+            counts += _shift(mask, -delta_y, delta_x)
+
+    return counts
+
+def evaluate_batch(states: Sequence[GameState] | PackedBoards, moves: dict[PieceType, Moves] | None = None) -> BatchFeatures:
+    packed = states if isinstance(states, PackedBoards) else pack_states(states)
+    moves = moves if moves is not None else CHOGI_MOVES
+
+    empty = packed.pieces == 0
+    occupied = {Player.p1: packed.pieces > 0, Player.p2: packed.pieces < 0}
+    counts = {
+        (player, protected): _attack_counts(packed, player, protected, moves)
+        for player in Player for protected in (True, False)
+    }
+    escape = {player: (counts[(player, True)] > 0) & empty for player in Player}
+
+    mobility = np.zeros((len(packed), len(Player)), dtype = np.int32)
+    lion_trapped = np.zeros((len(packed), len(Player)), dtype = np.bool_)
+    drop_squares = np.zeros((len(packed), len(Player)), dtype = np.int32)
+
+    for player in Player:
+        enemy = Player.p1 if player is not Player.p1 else Player.p2
+        index = PLAYER_INDEX[player]
+        capturable = occupied[enemy] & ~packed.protected
+
+        mobility[:, index] = (
+            (counts[(player, False)] * (empty | capturable)).sum(axis = (1, 2)) +
+            (counts[(player, True)] * empty).sum(axis = (1, 2))
+        )
+
+        infiltrators = (counts[(enemy, True)] > 0) & occupied[player]
+        countered = (infiltrators & (counts[(enemy, False)] > 0)).any(axis = (1, 2))
+        infiltrations = (counts[(enemy, True)] * occupied[player]).sum(axis = (1, 2))
+        lion_trapped[:, index] = ~escape[enemy].any(axis = (1, 2)) & countered & (infiltrations > 1)
+
+        drops = (empty & ~escape[enemy]).sum(axis = (1, 2))
+        drop_squares[:, index] = np.where(packed.hands[:, index] > 0, drops, 0)
+
+    return BatchFeatures(mobility, lion_trapped, drop_squares)
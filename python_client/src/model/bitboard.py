@@ -0,0 +1,112 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from .project_types import (
+    BoardStatus, Location, MoveTable, Piece, PieceType, Player, Trait
+)
+
+def iter_squares(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+class AttackMap:
+    def __init__(self, squares: int):
+        self._counts: dict[tuple[Player, bool], list[int]] = {
+            (player, protected): [0] * squares for player in Player for protected in (True, False)
+        }
+        self._masks: dict[tuple[Player, bool], int] = {
+            (player, protected): 0 for player in Player for protected in (True, False)
+        }
+
+    def add(self, player: Player, protected: bool, attacked: int):
+        counts = self._counts[(player, protected)]
+        for square in iter_squares(attacked):
+            counts[square] += 1
+        self._masks[(player, protected)] |= attacked
+
+    def remove(self, player: Player, protected: bool, attacked: int):
+        counts = self._counts[(player, protected)]
+        cleared = 0
+        for square in iter_squares(attacked):
+            counts[square] -= 1
+            if not counts[square]:
+                cleared |= 1 << square
+        self._masks[(player, protected)] &= ~cleared
+
+    def mask(self, player: Player, protected: bool) -> int:
+        return self._masks[(player, protected)]
+
+    def count(self, player: Player, protected: bool, square: int) -> int:
+        return self._counts[(player, protected)][square]
+
+class Bitboard:
+    def __init__(self, move_table: MoveTable):
+        self._row = move_table.get_row
+        self._col = move_table.get_col
+        self._full = (1 << (self._row * self._col)) - 1
+        self._move_table = move_table
+        self.clear()
+
+    def clear(self):
+        self._masks: dict[tuple[PieceType, Player], int] = {}
+        self._occupied: dict[Player, int] = {player: 0 for player in Player}
+        self._protected: dict[Player, int] = {player: 0 for player in Player}
+        self._attack_map = AttackMap(self._row * self._col)
+
+    def load(self, board_status: BoardStatus):
+        self.clear()
+        for row in board_status:
+            for piece in row:
+                if piece is not None and piece.get_location is not None:
+                    self.place(piece.get_location, piece)
+
+    def square(self, location: Location) -> int:
+        return location.row * self._col + location.col
+
+    def location(self, square: int) -> Location:
+        return self._move_table.location(square)
+
+    def bit(self, location: Location) -> int:
+        return 1 << self.square(location)
+
+    def place(self, location: Location, piece: Piece):
+        bit = self.bit(location)
+        key = (piece.get_piece_type, piece.get_player)
+        protected = Trait.protected in piece.get_traits
+        self._masks[key] = self._masks.get(key, 0) | bit
+        self._occupied[piece.get_player] |= bit
+        if protected:
+            self._protected[piece.get_player] |= bit
+        self._attack_map.add(piece.get_player, protected, self.attacks_from(piece, location))
+
+    def remove(self, location: Location, piece: Piece):
+        bit = ~self.bit(location)
+        key = (piece.get_piece_type, piece.get_player)
+        self._masks[key] = self._masks.get(key, 0) & bit
+        self._occupied[piece.get_player] &= bit
+        self._protected[piece.get_player] &= bit
+        self._attack_map.remove(piece.get_player, Trait.protected in piece.get_traits, self.attacks_from(piece, location))
+
+    def attacks_from(self, piece: Piece, location: Location) -> int:
+        return self._move_table.masks(piece.get_piece_type, piece.get_player)[self.square(location)]
+
+    def attacks(self, player: Player, protected: bool) -> int:
+        return self._attack_map.mask(player, protected)
+
+    def escape_squares(self, player: Player) -> int:
+        return self._attack_map.mask(player, True) & self.empty
+
+    def infiltrations(self, player: Player) -> int:
+        enemy = self._occupied[Player.p1 if player is not Player.p1 else Player.p2]
+        return sum(self._attack_map.count(player, True, square) for square in iter_squares(self._attack_map.mask(player, True) & enemy))
+
+    def occupied(self, player: Player) -> int:
+        return self._occupied[player]
+
+    def protected(self, player: Player) -> int:
+        return self._protected[player]
+
+    @property
+    def empty(self) -> int:
+        return self._full & ~(self._occupied[Player.p1] | self._occupied[Player.p2])
@@ -0,0 +1,74 @@
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from .project_types import (
+    Action, GameStatus, Piece, Player
+)
+
+@dataclass(frozen = True)
+class JournalEntry:
+    action: Action
+    player: Player
+    piece: Piece
+    placed: Piece
+    captured: Piece | None
+    hand_index: int
+    prev_status: GameStatus
+    prev_turn: Player
+    prev_moves_left: int
+    next_status: GameStatus
+    next_turn: Player
+    next_moves_left: int
+    undo_blocked: bool
+
+class Journal:
+    def __init__(self, capacity: int = 1024):
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+
+        self._done: deque[JournalEntry] = deque(maxlen = capacity)
+        self._undone: deque[JournalEntry] = deque(maxlen = capacity)
+
+    def clear(self):
+        self._done.clear()
+        self._undone.clear()
+
+    def record(self, entry: JournalEntry):
+        self._done.append(entry)
+        self._undone.clear()
+
+    def peek(self) -> JournalEntry | None:
+        return self._done[-1] if self._done else None
+
+    def undo(self) -> JournalEntry | None:
+        if not self._done:
+            return None
+
+        entry = self._done.pop()
+        self._undone.append(entry)
+        return entry
+
+    def redo(self) -> JournalEntry | None:
+        if not self._undone:
+            return None
+
+        entry = self._undone.pop()
+        self._done.append(entry)
+        return entry
+
+    def snapshot(self) -> tuple[tuple[JournalEntry, ...], tuple[JournalEntry, ...]]:
+        return tuple(self._done), tuple(self._undone)
+
+    def restore(self, snapshot: tuple[tuple[JournalEntry, ...], tuple[JournalEntry, ...]]):
+        done, undone = snapshot
+        self._done.clear()
+        self._done.extend(done)
+        self._undone.clear()
+        self._undone.extend(undone)
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._undone)
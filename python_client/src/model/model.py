@@ -1,314 +1,401 @@
-from dataclasses import replace
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
 from .project_types import (
     Board, PieceInfo, Piece, GameStatus, GameState, 
-    Location, Player, Trait
+    Location, Player, Trait, Action, ActionType, PieceType
 )
+from .bitboard import Bitboard, iter_squares
+from .zobrist import ZobristKeys
+from .persistent import freeze_board, set_squares, hand_with
+from .journal import Journal, JournalEntry
+
+@dataclass(frozen = True)
+class Savepoint:
+    state: GameState
+    journal: tuple[tuple[JournalEntry, ...], tuple[JournalEntry, ...]]
+    undo_blocked: bool
 
 class Model:
-    def __init__(self, board: Board, piece_info: PieceInfo):
+    def __init__(self, board: Board, piece_info: PieceInfo, history_limit: int = 1024):
         self._max_moves = 3
+        self._setup(board, piece_info, ZobristKeys(board.get_row, board.get_col, self._max_moves), history_limit)
+        self.new_game()
+
+    def _setup(self, board: Board, piece_info: PieceInfo, zobrist: ZobristKeys, history_limit: int):
         self._board = board
         self._piece_info = piece_info
-        self.new_game()
+        self._bitboard = Bitboard(board.get_move_table)
+        self._zobrist = zobrist
+        self._journal = Journal(history_limit)
+
+        self._version = 0
+        self._position_version = 0
+        self._legal_actions_version = -1
+        self._legal_actions: list[Action] = []
+        self._legal_actions_generator: Iterator[Action] | None = None
 
     def new_game(self):
         self._board.setup(self._piece_info)
         self._state: GameState = GameState(
             game_status = GameStatus.ongoing,
-            board_status = self._board.get_board,
+            board_status = freeze_board(self._board.get_board),
             turn = Player.p1,
             selected_piece = None,
             moves_left = self._max_moves,
-            P1_captured = [],
-            P2_captured = []
+            P1_captured = (),
+            P2_captured = (),
+            version = self._version + 1
         )
+        self._bitboard.load(self._state.board_status)
+        self._hash = self._zobrist.hash_state(self._state)
+        self._version += 1
+        self._position_version += 1
 
-        self._prev_state: GameState | None = None
-        self._recent_state: list[GameState] = []
-  
-    def _get_all_enemy_moves(self) -> list[Location]:
-        all_pieces: list[Piece] = []
-        
-        for row in self._state.board_status:
-            for piece in row:
-                if piece is not None:
-                    all_pieces.append(piece)
+        self._journal.clear()
+        self._undo_blocked = False
+
+    def _put(self, location: Location, piece: Piece):
+        self._bitboard.place(location, piece)
+        self._hash ^= self._zobrist.piece(piece, location.row, location.col)
 
-        all_moves: list[Location] = []
+    def _lift(self, location: Location, piece: Piece):
+        self._bitboard.remove(location, piece)
+        self._hash ^= self._zobrist.piece(piece, location.row, location.col)
 
-        for piece in all_pieces:
-            for delta_x, delta_y in piece.get_moves:
-                if piece.get_location is not None:
-                    new_row = piece.get_location.row - delta_y
-                    new_col = piece.get_location.col - delta_x
-                    if piece.get_player is not self._state.turn:
-                        all_moves.append(Location(row = new_row, col = new_col))
+    def _hand_count(self, captured: tuple[Piece, ...], piece_type: PieceType) -> int:
+        return sum(1 for piece in captured if piece.get_piece_type is piece_type)
 
-        return all_moves
+    def _rehand(self, player: Player, piece_type: PieceType, before: tuple[Piece, ...], after: tuple[Piece, ...]):
+        self._hash ^= self._zobrist.hand(piece_type, player, self._hand_count(before, piece_type))
+        self._hash ^= self._zobrist.hand(piece_type, player, self._hand_count(after, piece_type))
+  
+    def _get_all_enemy_moves(self) -> list[Location]:
+        enemy = Player.p1 if self._state.turn is not Player.p1 else Player.p2
+        attacked = self._bitboard.attacks(enemy, protected = True) | self._bitboard.attacks(enemy, protected = False)
 
-    def _is_draw(self) -> bool:
-        return (self._is_checkmate(Player.p1) and self._is_checkmate(Player.p2))
+        return [self._bitboard.location(square) for square in iter_squares(attacked)]
 
     def _is_checkmate(self, player: Player) -> bool:
-        protected_pieces: list[Piece] = []
-        counter_pieces: list[Piece] = []
-
-        for row in self._state.board_status:
-            for piece in row:
-                if piece is not None:
-                    if piece.get_player is not player:
-                        if Trait.protected in piece.get_traits:
-                            protected_pieces.append(piece)
-                        else:
-                            counter_pieces.append(piece)
-
-        paths: list[Location] = []
-        infiltrators: list[Piece] = []
-
-        for piece in protected_pieces:
-            for delta_x, delta_y in piece.get_moves:
-                if piece.get_location is not None:
-                    new_row = piece.get_location.row - delta_y
-                    new_col = piece.get_location.col - delta_x
-                    if new_row in range(self._board.get_row) and new_col in range(self._board.get_col):
-                        target_piece = self._state.board_status[new_row][new_col]
-                        if target_piece is None:
-                            paths.append(Location(row = new_row, col = new_col))
-                        else:
-                            if target_piece.get_player is player:
-                                infiltrators.append(target_piece)
-        
-        counter_locations: list[Location] = []
-        for piece in counter_pieces:
-            for delta_x, delta_y in piece.get_moves:
-                if piece.get_location is not None:
-                    new_row = piece.get_location.row - delta_y
-                    new_col = piece.get_location.col - delta_x
-                    if new_row in range(self._board.get_row) and new_col in range(self._board.get_col):
-                        target_piece = self._state.board_status[new_row][new_col]
-                        if target_piece is not None:
-                            if target_piece.get_player is player and target_piece.get_location is not None:
-                                counter_locations.append(target_piece.get_location)
-
-        if not paths:
-            for piece in infiltrators:
-                if piece.get_player is player and piece.get_location in counter_locations:
-                    if len(infiltrators) > 1:
-                        return True
-                    return False
-                
-        return False
+        opponent = Player.p1 if player is not Player.p1 else Player.p2
 
-    def _copy_state(self) -> GameState:
-        game_status = self._state.game_status
-        board_status: list[list[Piece | None]] = [[
-            Piece(
-                piece.get_location,
-                piece.get_piece_type,
-                piece.get_traits,
-                piece.get_moves,
-                piece.get_player  
-            ) if piece is not None else None for piece in row] for row in self._state.board_status]
-        turn = self._state.turn
-        moves_left = self._state.moves_left
-        
-        selected_piece = None
-
-        if self._state.selected_piece is not None:
-            location = self._state.selected_piece.get_location
-            piece_type = self._state.selected_piece.get_piece_type
-            traits = self._state.selected_piece.get_traits
-            moves = self._state.selected_piece.get_moves
-            player = self._state.selected_piece.get_player
-
-            selected_piece = Piece(location, piece_type, traits, moves, player)
-
-        P1_captured: list[Piece] = [
-            Piece(
-                piece.get_location,
-                piece.get_piece_type,
-                piece.get_traits,
-                piece.get_moves,
-                piece.get_player  
-            ) for piece in self._state.P1_captured]
-
-        P2_captured: list[Piece] = [
-            Piece(
-                piece.get_location,
-                piece.get_piece_type,
-                piece.get_traits,
-                piece.get_moves,
-                piece.get_player
-            ) for piece in self._state.P2_captured]
-
-        return GameState(
-                game_status = game_status,
-                board_status = board_status,
-                turn = turn,
-                selected_piece = selected_piece,
-                moves_left = moves_left,
-                P1_captured = P1_captured,
-                P2_captured = P2_captured
-            )
+        if self._bitboard.escape_squares(opponent):
+            return False
+
+        counter_moves = self._bitboard.attacks(opponent, protected = False)
+        infiltrators = self._bitboard.attacks(opponent, protected = True) & self._bitboard.occupied(player)
+
+        return bool(infiltrators & counter_moves) and self._bitboard.infiltrations(opponent) > 1
 
     def piece_select(self, piece: Piece, player: Player):
-        if piece.get_player is self._state.turn and player is self._state.turn:
-            self._state = self.state.change_to({
+        if piece.get_player is self._state.turn and player is self._state.turn and piece != self._state.selected_piece:
+            self._publish({
                 'selected_piece': piece
             })
 
-            self._prev_state = self._copy_state()
+    def _move_targets(self, piece: Piece, location: Location, enemy: Player) -> int:
+        allowed = self._bitboard.empty
+        if Trait.protected not in piece.get_traits:
+            allowed |= self._bitboard.occupied(enemy) & ~self._bitboard.protected(enemy)
+
+        return self._bitboard.attacks_from(piece, location) & allowed
+
+    def _drop_targets(self, enemy: Player) -> int:
+        return self._bitboard.empty & ~self._bitboard.escape_squares(enemy)
+
+    def _generate_legal_actions(self) -> Iterator[Action]:
+        if self._state.game_status is not GameStatus.ongoing:
+            return
+
+        turn = self._state.turn
+        enemy = Player.p1 if turn is not Player.p1 else Player.p2
+        own = self._bitboard.occupied(turn)
+
+        for square in iter_squares(own):
+            location = self._bitboard.location(square)
+            piece = self._state.board_status[location.row][location.col]
+            if piece is None:
+                continue
+
+            for target in iter_squares(self._move_targets(piece, location, enemy)):
+                yield Action(ActionType.move, piece.get_piece_type, location, self._bitboard.location(target))
+
+        captured = self._state.P1_captured if turn is Player.p1 else self._state.P2_captured
+        if captured:
+            drop_squares = [self._bitboard.location(square) for square in iter_squares(self._drop_targets(enemy))]
+
+            for piece_type in dict.fromkeys(piece.get_piece_type for piece in captured):
+                for target in drop_squares:
+                    yield Action(ActionType.drop, piece_type, None, target)
+
+    def legal_actions(self) -> Iterator[Action]:
+        if self._legal_actions_version != self._position_version:
+            self._legal_actions_version = self._position_version
+            self._legal_actions = []
+            self._legal_actions_generator = self._generate_legal_actions()
+
+        version = self._position_version
+        actions = self._legal_actions
+        index = 0
+
+        while version == self._position_version:
+            if index < len(actions):
+                yield actions[index]
+                index += 1
+            elif self._legal_actions_generator is not None:
+                action = next(self._legal_actions_generator, None)
+                if action is None:
+                    self._legal_actions_generator = None
+                else:
+                    actions.append(action)
+            else:
+                return
+
+    def _is_legal(self, action: Action) -> bool:
+        state = self._state
+        if state.game_status is not GameStatus.ongoing:
+            return False
+
+        turn = state.turn
+        enemy = Player.p1 if turn is not Player.p1 else Player.p2
+        target = self._bitboard.bit(action.target)
+
+        if action.action_type is ActionType.move:
+            if action.source is None:
+                return False
+
+            piece = state.board_status[action.source.row][action.source.col]
+            if piece is None or piece.get_player is not turn or piece.get_piece_type is not action.piece_type:
+                return False
+
+            return bool(self._move_targets(piece, action.source, enemy) & target)
+
+        captured = state.P1_captured if turn is Player.p1 else state.P2_captured
+        if action.source is not None or not any(piece.get_piece_type is action.piece_type for piece in captured):
+            return False
+
+        return bool(self._drop_targets(enemy) & target)
 
     def _is_move_valid(self, target_location: Location) -> bool:
-        if self._state.selected_piece is not None:
-            if self._state.board_status[target_location.row][target_location.col] is not None:
-                target_piece = self._state.board_status[target_location.row][target_location.col]
-                if target_piece is not None:
-                    if self._state.selected_piece.get_player is target_piece.get_player or Trait.protected in self._state.selected_piece.get_traits:
-                        return False
-                    if Trait.protected in target_piece.get_traits:
-                        return False
-            
-            for delta_x, delta_y in self._state.selected_piece.get_moves:
-                if self._state.selected_piece.get_location is not None:
-                    new_row = self._state.selected_piece.get_location.row - delta_y
-                    new_col = self._state.selected_piece.get_location.col + delta_x
-                    if new_row == target_location.row and new_col == target_location.col:
-                        return True            
-        
+        selected_piece = self._state.selected_piece
+        if selected_piece is not None and selected_piece.get_location is not None:
+            return self._is_legal(Action(ActionType.move, selected_piece.get_piece_type, selected_piece.get_location, target_location))
+
         return False
 
-    def move(self, target_location: Location, player: Player):
-        if player is self._state.turn and self._state.selected_piece is not None:
-            if self._is_move_valid(target_location):
-                new_board_status: list[list[Piece | None]] = self._state.board_status
-                target_piece: Piece | None = new_board_status[target_location.row][target_location.col]
-                if target_piece is not None:
-                    target_piece.get_player = self._state.selected_piece.get_player
-                    target_piece.get_moves = [(x*-1, y*-1) for x, y in target_piece.get_moves]
-                    target_piece.get_location = None
-
-                    if self._state.selected_piece.get_player is Player.p1:
-                        self._state.P1_captured.append(target_piece)
-                    else:
-                        self._state.P2_captured.append(target_piece)
-
-                new_board_status[target_location.row][target_location.col] = self._state.selected_piece
-
-                current_location: Location | None = self._state.selected_piece.get_location
-                if current_location is not None:
-                    new_board_status[current_location.row][current_location.col] = None
-
-                selected_piece: Piece | None = new_board_status[target_location.row][target_location.col]
-                if selected_piece is not None:
-                    selected_piece.get_location = target_location
-
-                new_player = Player.p1 if self._state.turn is not Player.p1 else Player.p2
-
-                if self._is_draw():
-                    self._state = self.state.change_to({
-                        'game_status': GameStatus.draw,
-                        'board_status': new_board_status, 
-                        'selected_piece': None
-                    })
-                elif self._is_checkmate(self._state.turn):
-                    self._state = self.state.change_to({
-                        'game_status': GameStatus.has_winner,
-                        'board_status': new_board_status, 
-                        'selected_piece': None
-                    })
-                else:
-                    self._state = self.state.change_to({
-                        'board_status': new_board_status, 
-                        'turn': new_player if self._state.moves_left - 1 == 0 else self._state.turn,
-                        'moves_left': self._state.moves_left - 1 if self._state.moves_left - 1 != 0 else self._max_moves,
-                        'selected_piece': None
-                    })
-
-                if self._recent_state:
-                    self._recent_state = []
-                if self._prev_state is not None:
-                    self._recent_state.append(self._prev_state)
-
-            self._state = self.state.change_to({
-                'selected_piece': None
-            })
+    def _publish(self, new: GameState.New):
+        self._version += 1
+        new['version'] = self._version
+        self._state = self._state.change_to(new)
+
+    def _shift(self, entry: JournalEntry, forward: bool) -> GameState.New:
+        action = entry.action
+        board_status = self._state.board_status
+        hand = self._state.P1_captured if entry.player is Player.p1 else self._state.P2_captured
+        before = hand
+        changes: dict[Location, Piece | None] = {}
+
+        if forward:
+            if entry.captured is not None:
+                self._lift(action.target, entry.captured)
+                captured_piece = entry.captured.captured_by(entry.player)
+                hand = hand_with(hand, captured_piece)
+                self._rehand(entry.player, captured_piece.get_piece_type, before, hand)
+
+            if action.source is not None:
+                self._lift(action.source, entry.piece)
+                changes[action.source] = None
+            else:
+                hand = hand[:entry.hand_index] + hand[entry.hand_index + 1:]
+                self._rehand(entry.player, entry.piece.get_piece_type, before, hand)
+
+            self._put(action.target, entry.placed)
+            changes[action.target] = entry.placed
+        else:
+            self._lift(action.target, entry.placed)
+            changes[action.target] = entry.captured
+
+            if action.source is not None:
+                self._put(action.source, entry.piece)
+                changes[action.source] = entry.piece
+            else:
+                hand = hand[:entry.hand_index] + (entry.piece,) + hand[entry.hand_index:]
+                self._rehand(entry.player, entry.piece.get_piece_type, before, hand)
+
+            if entry.captured is not None:
+                self._put(action.target, entry.captured)
+                hand = hand[:-1]
+                self._rehand(entry.player, entry.captured.get_piece_type, before, hand)
+
+        return {
+            'board_status': set_squares(board_status, changes),
+            'P1_captured': hand if entry.player is Player.p1 else self._state.P1_captured,
+            'P2_captured': hand if entry.player is Player.p2 else self._state.P2_captured,
+            'selected_piece': None
+        }
+
+    def _progress(self, game_status: GameStatus, turn: Player, moves_left: int) -> GameState.New:
+        self._hash ^= self._zobrist.turn(self._state.turn, self._state.moves_left)
+        self._hash ^= self._zobrist.turn(turn, moves_left)
+        self._position_version += 1
+
+        return {
+            'game_status': game_status,
+            'turn': turn,
+            'moves_left': moves_left
+        }
+
+    def _make(self, action: Action):
+        state = self._state
+        player = state.turn
+
+        if action.source is not None:
+            piece = state.board_status[action.source.row][action.source.col]
+            hand_index = -1
+        else:
+            hand = state.P1_captured if player is Player.p1 else state.P2_captured
+            hand_index = next(index for index, captured in enumerate(hand) if captured.get_piece_type is action.piece_type)
+            piece = hand[hand_index]
+
+        if piece is None:
+            return
+
+        entry = JournalEntry(
+            action = action,
+            player = player,
+            piece = piece,
+            placed = piece.moved_to(action.target),
+            captured = state.board_status[action.target.row][action.target.col],
+            hand_index = hand_index,
+            prev_status = state.game_status,
+            prev_turn = state.turn,
+            prev_moves_left = state.moves_left,
+            next_status = state.game_status,
+            next_turn = state.turn,
+            next_moves_left = state.moves_left,
+            undo_blocked = self._undo_blocked
+        )
+        shifted = self._shift(entry, forward = True)
+
+        new_player = Player.p1 if player is not Player.p1 else Player.p2
+        is_checkmate = action.action_type is ActionType.move and self._is_checkmate(player)
+
+        if is_checkmate and self._is_checkmate(new_player):
+            entry = replace(entry, next_status = GameStatus.draw)
+        elif is_checkmate:
+            entry = replace(entry, next_status = GameStatus.has_winner)
+        else:
+            entry = replace(entry,
+                next_turn = new_player if state.moves_left - 1 == 0 else player,
+                next_moves_left = state.moves_left - 1 if state.moves_left - 1 != 0 else self._max_moves
+            )
+
+        shifted.update(self._progress(entry.next_status, entry.next_turn, entry.next_moves_left))
+        self._publish(shifted)
+        self._journal.record(entry)
+        self._undo_blocked = False
+
+    def make(self, action: Action) -> bool:
+        if not self._is_legal(action):
+            return False
+
+        self._make(action)
+        return True
+
+    def unmake(self) -> bool:
+        entry = self._journal.undo()
+        if entry is None:
+            return False
 
-    def _is_drop_valid(self, target_location: Location):
-        protected_pieces: list[Piece] = []
-        paths: list[Location] = []
-
-        for row in self._state.board_status:
-            for piece in row:
-                if piece is not None:
-                    if Trait.protected in piece.get_traits:
-                        if piece.get_player is not self._state.turn:
-                            protected_pieces.append(piece)
-        
-        for piece in protected_pieces:
-            for delta_x, delta_y in piece.get_moves:
-                if piece.get_location is not None:
-                    new_row = piece.get_location.row - delta_y
-                    new_col = piece.get_location.col - delta_x
-                    if new_row in range(self._board.get_row) and new_col in range(self._board.get_col):
-                        target_piece = self._state.board_status[new_row][new_col]
-                        if target_piece is None:
-                            paths.append(Location(row = new_row, col = new_col))
-
-        if target_location in paths:
+        shifted = self._shift(entry, forward = False)
+        shifted.update(self._progress(entry.prev_status, entry.prev_turn, entry.prev_moves_left))
+        self._publish(shifted)
+        self._undo_blocked = entry.undo_blocked
+        return True
+
+    def redo(self) -> bool:
+        entry = self._journal.redo()
+        if entry is None:
             return False
 
+        shifted = self._shift(entry, forward = True)
+        shifted.update(self._progress(entry.next_status, entry.next_turn, entry.next_moves_left))
+        self._publish(shifted)
+        self._undo_blocked = False
         return True
 
+    def move(self, target_location: Location, player: Player):
+        selected_piece = self._state.selected_piece
+        if player is self._state.turn and selected_piece is not None:
+            if self._is_move_valid(target_location) and selected_piece.get_location is not None:
+                self._make(Action(ActionType.move, selected_piece.get_piece_type, selected_piece.get_location, target_location))
+            else:
+                self._publish({
+                    'selected_piece': None
+                })
+
+    def _is_drop_valid(self, target_location: Location) -> bool:
+        selected_piece = self._state.selected_piece
+        if selected_piece is not None and selected_piece.get_location is None:
+            return self._is_legal(Action(ActionType.drop, selected_piece.get_piece_type, None, target_location))
+
+        return False
+
     def drop(self, target_location: Location, player: Player):
-        if player is self._state.turn:
-            new_board_status = self._state.board_status
-            if new_board_status[target_location.row][target_location.col] is None:
-                if self._is_drop_valid(target_location):
-                    if self._state.selected_piece is not None:
-                        if self._state.selected_piece.get_player is Player.p1:
-                            for captured in self._state.P1_captured:
-                                if self._state.selected_piece == captured:
-                                    self._state.P1_captured.remove(captured)
-                        else:
-                            for captured in self._state.P2_captured:
-                                if self._state.selected_piece == captured:
-                                    self._state.P2_captured.remove(captured)
-
-                    new_board_status[target_location.row][target_location.col] = self._state.selected_piece
-                    dropped: None | Piece = new_board_status[target_location.row][target_location.col]
-
-                    if dropped is not None:
-                        dropped.get_location = target_location
-
-                    new_player = Player.p1 if self._state.turn is not Player.p1 else Player.p2
-
-                    self._state = self.state.change_to({
-                        'board_status': new_board_status,
-                        'turn': new_player if self._state.moves_left - 1 == 0 else self._state.turn,
-                        'moves_left': self._state.moves_left - 1 if self._state.moves_left - 1 != 0 else self._max_moves,
-                        'selected_piece': None
-                    })
-
-                    if self._recent_state:
-                        self._recent_state = []
-                    if self._prev_state is not None:
-                        self._recent_state.append(self._prev_state)
-
-        self._state = self.state.change_to({
-            'selected_piece': None
-        })
+        selected_piece = self._state.selected_piece
+        if player is self._state.turn and selected_piece is not None and self._is_drop_valid(target_location):
+            self._make(Action(ActionType.drop, selected_piece.get_piece_type, None, target_location))
+        elif selected_piece is not None:
+            self._publish({
+                'selected_piece': None
+            })
 
     def undo(self, player: Player):
-        if self._recent_state[-1].selected_piece is not None:
-            if self._recent_state[-1].selected_piece.get_location is not None and player is self._recent_state[-1].turn:
-                if Trait.can_undo in self._recent_state[-1].selected_piece.get_traits:
-                    self._state = self._recent_state[-1]
-                    self._state = self.state.change_to({
-                        'selected_piece': None
-                    })
-                    self._recent_state[:-1]
+        entry = self._journal.peek()
+        if entry is not None and not self._undo_blocked:
+            if entry.action.source is not None and player is entry.player:
+                if Trait.can_undo in entry.piece.get_traits:
+                    self.unmake()
+                    self._undo_blocked = True
+
+    def savepoint(self) -> Savepoint:
+        return Savepoint(self._state, self._journal.snapshot(), self._undo_blocked)
+
+    def _load(self, state: GameState):
+        self._bitboard.load(state.board_status)
+        self._hash = self._zobrist.hash_state(state)
+        self._position_version += 1
+        self._state = state
+
+    def rollback(self, savepoint: Savepoint):
+        self._journal.restore(savepoint.journal)
+        self._undo_blocked = savepoint.undo_blocked
+        self._load(savepoint.state)
+        self._publish({})
+
+    def fork(self, history_limit: int = 1024) -> 'Model':
+        model = Model.__new__(Model)
+        model._max_moves = self._max_moves
+        model._setup(self._board, self._piece_info, self._zobrist, history_limit)
+        model._version = self._version
+        model._load(self._state)
+        model._undo_blocked = self._undo_blocked
+        return model
+
+    def piece_at(self, location: Location) -> Piece | None:
+        return self._state.board_status[location.row][location.col]
+
+    @property
+    def can_redo(self) -> bool:
+        return self._journal.can_redo
+
+    @property
+    def position_hash(self) -> int:
+        return self._hash
+
+    @property
+    def position_version(self) -> int:
+        return self._position_version
 
     @property
     def state(self) -> GameState:
-        return replace(self._state)
\ No newline at end of file
+        return self._state
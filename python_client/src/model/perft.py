@@ -0,0 +1,28 @@
+from __future__ import annotations
+from .model import Model
+from .project_types import Action
+
+def perft(model: Model, depth: int) -> int:
+    if depth <= 0:
+        return 1
+
+    actions = list(model.legal_actions())
+    if depth == 1:
+        return len(actions)
+
+    nodes = 0
+    for action in actions:
+        model.make(action)
+        nodes += perft(model, depth - 1)
+        model.unmake()
+
+    return nodes
+
+def divide(model: Model, depth: int) -> dict[Action, int]:
+    counts: dict[Action, int] = {}
+    for action in list(model.legal_actions()):
+        model.make(action)
+        counts[action] = perft(model, depth - 1)
+        model.unmake()
+
+    return counts
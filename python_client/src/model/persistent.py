@@ -0,0 +1,23 @@
+from __future__ import annotations
+from .project_types import (
+    BoardStatus, Location, Piece
+)
+
+def freeze_board(board: list[list[Piece | None]]) -> BoardStatus:
+    return tuple(tuple(row) for row in board)
+
+def set_squares(board_status: BoardStatus, changes: dict[Location, Piece | None]) -> BoardStatus:
+    touched: dict[int, list[Piece | None]] = {}
+    for location, piece in changes.items():
+        if location.row not in touched:
+            touched[location.row] = list(board_status[location.row])
+        touched[location.row][location.col] = piece
+
+    rows = list(board_status)
+    for row, squares in touched.items():
+        rows[row] = tuple(squares)
+
+    return tuple(rows)
+
+def hand_with(hand: tuple[Piece, ...], piece: Piece) -> tuple[Piece, ...]:
+    return (*hand, piece)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from enum import StrEnum, auto
 from dataclasses import dataclass, replace
+from collections.abc import Callable, Iterable, Sequence
+from functools import cache
 from typing import Self, Protocol, TypedDict
 
 class Player(StrEnum):
@@ -18,7 +20,7 @@ class Location:
     col: int
 
 class PieceInfo(Protocol):
-    def get_piece_info(self) -> list[tuple[Location, PieceType, list[Trait], list[tuple[int, int]], Player]]:
+    def get_piece_info(self) -> list[tuple[Location, PieceType, list[Trait], Sequence[tuple[int, int]], Player]]:
         ...
 
 class Board(Protocol):
@@ -40,24 +42,30 @@ class Board(Protocol):
     def get_board(self) -> list[list[Piece | None]]:
         ...
 
+    @property
+    def get_move_table(self) -> MoveTable:
+        ...
+
 @dataclass(frozen = True)
 class GameState:
     game_status: GameStatus
-    board_status: list[list[Piece | None]]
+    board_status: BoardStatus
     turn: Player
     moves_left: int
     selected_piece: Piece | None
-    P1_captured: list[Piece]
-    P2_captured: list[Piece]
+    P1_captured: tuple[Piece, ...]
+    P2_captured: tuple[Piece, ...]
+    version: int = 0
 
     class New(TypedDict, total=False):
         game_status: GameStatus
-        board_status: list[list[Piece | None]]
+        board_status: BoardStatus
         turn: Player
         moves_left: int
         selected_piece: Piece | None
-        P1_captured: list[Piece]
-        P2_captured: list[Piece]
+        P1_captured: tuple[Piece, ...]
+        P2_captured: tuple[Piece, ...]
+        version: int
 
     def change_to(self, new: New) -> Self:
         ret = replace(self, **new)
@@ -78,91 +86,220 @@ class Trait(StrEnum):
     can_undo = auto()
 
 class Moves(Protocol):
-    forward = [(0, +1)]
-    diagonal = [(dr, dc) for dr in {-1, +1} for dc in {-1, +1}]
-    orthogonal = [(dr, dc) for dr in {-1, 0, +1} for dc in {-1, 0, +1} if 0 in {dr, dc} and (dr, dc) != (0, 0)]
+    forward = ((0, +1),)
+    diagonal = tuple((dr, dc) for dr in {-1, +1} for dc in {-1, +1})
+    orthogonal = tuple((dr, dc) for dr in {-1, 0, +1} for dc in {-1, 0, +1} if 0 in {dr, dc} and (dr, dc) != (0, 0))
 
-    def get_moves(self, player: Player) -> list[tuple[int, int]]:
+    def get_moves(self, player: Player) -> tuple[tuple[int, int], ...]:
         ...
 
+def _oriented(moves: tuple[tuple[int, int], ...]) -> dict[Player, tuple[tuple[int, int], ...]]:
+    return {Player.p1: moves, Player.p2: tuple((x*-1, y*-1) for x, y in moves)}
+
 class ChickMoves(Moves):
-    def get_moves(self, player: Player) -> list[tuple[int, int]]:
-        if player is Player.p2:
-            return [(x*-1, y*-1) for x, y in self.forward]
-        return self.forward
+    _moves = _oriented(Moves.forward)
+
+    def get_moves(self, player: Player) -> tuple[tuple[int, int], ...]:
+        return self._moves[player]
 
 class ElephantMoves(Moves):
-    def get_moves(self, player: Player) -> list[tuple[int, int]]:
-        if player is Player.p2:
-            return [(x*-1, y*-1) for x, y in self.diagonal]
-        return self.diagonal
+    _moves = _oriented(Moves.diagonal)
+
+    def get_moves(self, player: Player) -> tuple[tuple[int, int], ...]:
+        return self._moves[player]
 
 class GiraffeMoves(Moves):
-    def get_moves(self, player: Player) -> list[tuple[int, int]]:
-        if player is Player.p2:
-            return [(x*-1, y*-1) for x, y in self.orthogonal]
-        return self.orthogonal
+    _moves = _oriented(Moves.orthogonal)
+
+    def get_moves(self, player: Player) -> tuple[tuple[int, int], ...]:
+        return self._moves[player]
 
 class MonkeyMoves(Moves):
-    def get_moves(self, player: Player) -> list[tuple[int, int]]:
-        if player is Player.p2:
-            return [(x*-1, y*-1) for x, y in [*self.diagonal, *self.orthogonal]]
-        return [*self.diagonal, *self.orthogonal]
+    _moves = _oriented((*Moves.diagonal, *Moves.orthogonal))
+
+    def get_moves(self, player: Player) -> tuple[tuple[int, int], ...]:
+        return self._moves[player]
 
 class LionMoves(Moves):
-    def get_moves(self, player: Player) -> list[tuple[int, int]]:
-        if player is Player.p2:
-            return [(x*-1, y*-1) for x, y in [*self.diagonal, *self.orthogonal]]
-        return [*self.diagonal, *self.orthogonal]
+    _moves = _oriented((*Moves.diagonal, *Moves.orthogonal))
+
+    def get_moves(self, player: Player) -> tuple[tuple[int, int], ...]:
+        return self._moves[player]
+
+class MoveTable:
+    def __init__(self, row: int, col: int, moves: dict[PieceType, Moves]):
+        self._row = row
+        self._col = col
+        self._locations = tuple(Location(row = i, col = j) for i in range(row) for j in range(col))
+        self._destinations: dict[tuple[PieceType, Player], tuple[tuple[Location, ...], ...]] = {}
+        self._masks: dict[tuple[PieceType, Player], tuple[int, ...]] = {}
+
+        for piece_type, piece_moves in moves.items():
+            for player in Player:
+                destinations: list[tuple[Location, ...]] = []
+                masks: list[int] = []
+                for location in self._locations:
+                    targets = tuple(
+                        self._locations[(location.row - delta_y) * col + location.col + delta_x]
+                        for delta_x, delta_y in piece_moves.get_moves(player)
+                        if 0 <= location.row - delta_y < row and 0 <= location.col + delta_x < col
+                    )
+                    destinations.append(targets)
+                    masks.append(sum(1 << (target.row * col + target.col) for target in targets))
+
+                self._destinations[(piece_type, player)] = tuple(destinations)
+                self._masks[(piece_type, player)] = tuple(masks)
+
+    def destinations(self, piece_type: PieceType, player: Player, location: Location) -> tuple[Location, ...]:
+        return self._destinations[(piece_type, player)][location.row * self._col + location.col]
+
+    def masks(self, piece_type: PieceType, player: Player) -> tuple[int, ...]:
+        return self._masks[(piece_type, player)]
+
+    def location(self, square: int) -> Location:
+        return self._locations[square]
+
+    @property
+    def get_row(self) -> int:
+        return self._row
+
+    @property
+    def get_col(self) -> int:
+        return self._col
+
+CHOGI_MOVES: dict[PieceType, Moves] = {
+    PieceType.chick: ChickMoves(),
+    PieceType.elephant: ElephantMoves(),
+    PieceType.giraffe: GiraffeMoves(),
+    PieceType.monkey: MonkeyMoves(),
+    PieceType.lion: LionMoves()
+}
+
+@cache
+def chogi_move_table(row: int, col: int) -> MoveTable:
+    return MoveTable(row, col, CHOGI_MOVES)
     
-class Piece:
-    def __init__(self, location: Location | None, piece_type: PieceType, traits: list[Trait], moves: list[tuple[int, int]], player: Player):
-        self._location = location
+class PieceKind:
+    __slots__ = ('_piece_type', '_traits', '_moves', '_player', '_hash', '_captured')
+
+    _interned: dict[tuple[PieceType, tuple[Trait, ...], tuple[tuple[int, int], ...], Player], PieceKind] = {}
+
+    def __init__(self, piece_type: PieceType, traits: tuple[Trait, ...], moves: tuple[tuple[int, int], ...], player: Player):
         self._piece_type = piece_type
         self._traits = traits
         self._moves = moves
         self._player = player
+        self._hash = hash((piece_type, traits, moves, player))
+        self._captured: dict[Player, PieceKind] = {}
+
+    @classmethod
+    def of(cls, piece_type: PieceType, traits: Iterable[Trait], moves: Iterable[tuple[int, int]], player: Player) -> PieceKind:
+        key = (piece_type, tuple(traits), tuple((x, y) for x, y in moves), player)
+        kind = cls._interned.get(key)
+        if kind is None:
+            kind = cls._interned[key] = cls(*key)
+
+        return kind
+
+    def captured_by(self, player: Player) -> PieceKind:
+        kind = self._captured.get(player)
+        if kind is None:
+            kind = self._captured[player] = PieceKind.of(self._piece_type, self._traits, [(x*-1, y*-1) for x, y in self._moves], player)
+
+        return kind
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[Callable[..., PieceKind], tuple[PieceType, tuple[Trait, ...], tuple[tuple[int, int], ...], Player]]:
+        return (PieceKind.of, (self._piece_type, self._traits, self._moves, self._player))
+
+    @property
+    def get_piece_type(self) -> PieceType:
+        return self._piece_type
+
+    @property
+    def get_traits(self) -> tuple[Trait, ...]:
+        return self._traits
+
+    @property
+    def get_moves(self) -> tuple[tuple[int, int], ...]:
+        return self._moves
+
+    @property
+    def get_player(self) -> Player:
+        return self._player
+
+class Piece:
+    __slots__ = ('_kind', '_location', '_hash')
+
+    def __init__(self, location: Location | None, piece_type: PieceType, traits: Iterable[Trait], moves: Iterable[tuple[int, int]], player: Player):
+        self._kind = PieceKind.of(piece_type, traits, moves, player)
+        self._location = location
+        self._hash = hash((self._kind, location))
+
+    @classmethod
+    def of_kind(cls, kind: PieceKind, location: Location | None) -> Piece:
+        piece = cls.__new__(cls)
+        piece._kind = kind
+        piece._location = location
+        piece._hash = hash((kind, location))
+        return piece
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Piece):
             return NotImplemented
-        return (self._location, self._piece_type, self._traits, self._moves, self._player) == (other._location, other._piece_type, other._traits, other._moves, other._player)
+        return self._kind is other._kind and self._location == other._location
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def moved_to(self, location: Location) -> Piece:
+        return Piece.of_kind(self._kind, location)
+
+    def captured_by(self, player: Player) -> Piece:
+        return Piece.of_kind(self._kind.captured_by(player), None)
+
+    @property
+    def get_kind(self) -> PieceKind:
+        return self._kind
 
     @property
     def get_location(self) -> Location | None:
         return self._location
-    
-    @get_location.setter
-    def get_location(self, location: Location | None):
-        self._location = location
 
     @property
     def get_piece_type(self) -> PieceType:
-        return self._piece_type
+        return self._kind.get_piece_type
 
     @property
-    def get_traits(self) -> list[Trait]:
-        return self._traits
+    def get_traits(self) -> tuple[Trait, ...]:
+        return self._kind.get_traits
 
     @property
-    def get_moves(self) -> list[tuple[int, int]]:
-        return self._moves
-
-    @get_moves.setter
-    def get_moves(self, moves: list[tuple[int, int]]):
-        self._moves = moves
+    def get_moves(self) -> tuple[tuple[int, int], ...]:
+        return self._kind.get_moves
 
     @property
     def get_player(self) -> Player:
-        return self._player
+        return self._kind.get_player
 
-    @get_player.setter
-    def get_player(self, player: Player):
-        self._player = player
+BoardStatus = tuple[tuple[Piece | None, ...], ...]
+
+class ActionType(StrEnum):
+    move = auto()
+    drop = auto()
+
+@dataclass(frozen = True)
+class Action:
+    action_type: ActionType
+    piece_type: PieceType
+    source: Location | None
+    target: Location
 
 class ChogiPieceInfo(PieceInfo):
-    def get_piece_info(self) -> list[tuple[Location, PieceType, list[Trait], list[tuple[int, int]], Player]]:
-        piece_info: list[tuple[Location, PieceType, list[Trait], list[tuple[int, int]], Player]] = []
+    def get_piece_info(self) -> list[tuple[Location, PieceType, list[Trait], Sequence[tuple[int, int]], Player]]:
+        piece_info: list[tuple[Location, PieceType, list[Trait], Sequence[tuple[int, int]], Player]] = []
         for player in Player:
             if player is Player.p1:
                 piece_info += [(Location(6, i), PieceType.chick, [Trait.can_undo], ChickMoves().get_moves(player), player) for i in range(8)] + [
@@ -199,6 +336,7 @@ class ChogiBoard(Board):
     def __init__(self, row: int, col: int):
         self._row = row
         self._col = col
+        self._move_table = chogi_move_table(row, col)
 
     def setup(self, piece_info: PieceInfo):
         self._board: list[list[Piece | None]] = [[None for _ in range(self._col)] for _ in range(self._row)]
@@ -221,4 +359,8 @@ class ChogiBoard(Board):
 
     @property
     def get_board(self) -> list[list[Piece | None]]:
-        return self._board
\ No newline at end of file
+        return self._board
+
+    @property
+    def get_move_table(self) -> MoveTable:
+        return self._move_table
\ No newline at end of file
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from enum import StrEnum, auto
+from dataclasses import dataclass
+from .project_types import Action
+
+class Bound(StrEnum):
+    exact = auto()
+    lower = auto()
+    upper = auto()
+
+class Replacement(StrEnum):
+    depth_preferred = auto()
+    always_replace = auto()
+
+@dataclass(frozen = True)
+class TableEntry:
+    key: int
+    depth: int
+    value: float
+    bound: Bound
+    action: Action | None
+
+class TranspositionTable:
+    def __init__(self, capacity: int = 1 << 16, replacement: Replacement = Replacement.depth_preferred):
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+
+        self._capacity = capacity
+        self._replacement = replacement
+        self.clear()
+
+    def clear(self):
+        self._entries: list[TableEntry | None] = [None] * self._capacity
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    def probe(self, key: int) -> TableEntry | None:
+        entry = self._entries[key % self._capacity]
+        if entry is not None and entry.key == key:
+            self._hits += 1
+            return entry
+
+        self._misses += 1
+        return None
+
+    def store(self, key: int, depth: int, value: float, bound: Bound, action: Action | None = None):
+        index = key % self._capacity
+        current = self._entries[index]
+
+        if current is None:
+            self._size += 1
+        elif self._replacement is Replacement.depth_preferred and current.key != key and current.depth > depth:
+            return
+
+        self._entries[index] = TableEntry(key, depth, value, bound, action)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def get_capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def get_hits(self) -> int:
+        return self._hits
+
+    @property
+    def get_misses(self) -> int:
+        return self._misses
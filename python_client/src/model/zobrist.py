@@ -0,0 +1,57 @@
+from __future__ import annotations
+from .project_types import (
+    GameState, Piece, PieceType, Player
+)
+
+def _splitmix64(seed: int) -> int:
+    seed = (seed + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    seed = ((seed ^ (seed >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    seed = ((seed ^ (seed >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return seed ^ (seed >> 31)
+
+class ZobristKeys:
+    def __init__(self, row: int, col: int, max_moves: int):
+        self._col = col
+        squares = row * col
+        counter = 0
+
+        self._pieces: dict[tuple[PieceType, Player], list[int]] = {}
+        self._hands: dict[tuple[PieceType, Player], list[int]] = {}
+        for piece_type in PieceType:
+            for player in Player:
+                self._pieces[(piece_type, player)] = [_splitmix64(counter + square) for square in range(squares)]
+                counter += squares
+                self._hands[(piece_type, player)] = [0] + [_splitmix64(counter + count) for count in range(squares)]
+                counter += squares
+
+        self._turns: dict[tuple[Player, int], int] = {}
+        for player in Player:
+            for moves_left in range(max_moves + 1):
+                self._turns[(player, moves_left)] = _splitmix64(counter)
+                counter += 1
+
+    def piece(self, piece: Piece, row: int, col: int) -> int:
+        return self._pieces[(piece.get_piece_type, piece.get_player)][row * self._col + col]
+
+    def hand(self, piece_type: PieceType, player: Player, count: int) -> int:
+        return self._hands[(piece_type, player)][count]
+
+    def turn(self, player: Player, moves_left: int) -> int:
+        return self._turns[(player, moves_left)]
+
+    def hash_state(self, state: GameState) -> int:
+        key = self.turn(state.turn, state.moves_left)
+
+        for i, row in enumerate(state.board_status):
+            for j, piece in enumerate(row):
+                if piece is not None:
+                    key ^= self.piece(piece, i, j)
+
+        for captured in (state.P1_captured, state.P2_captured):
+            counts: dict[tuple[PieceType, Player], int] = {}
+            for piece in captured:
+                counts[(piece.get_piece_type, piece.get_player)] = counts.get((piece.get_piece_type, piece.get_player), 0) + 1
+            for (piece_type, player), count in counts.items():
+                key ^= self.hand(piece_type, player, count)
+
+        return key
@@ -0,0 +1,6 @@
+from .protocol import (MessageCodec, Message, Opcode, ProtocolError, PROTOCOL_VERSION, SEQUENCE_MODULUS, resolve_piece, select_message)
+from .inbound import InboundQueue
+from .worker import (Connection, NetworkWorker, ReceivedMessage)
+from .prediction import (PREDICTED_OPCODES, PredictionBuffer, Reconciliation)
+
+__all__ = ['MessageCodec', 'Message', 'Opcode', 'ProtocolError', 'PROTOCOL_VERSION', 'SEQUENCE_MODULUS', 'resolve_piece', 'select_message', 'InboundQueue', 'Connection', 'NetworkWorker', 'ReceivedMessage', 'PREDICTED_OPCODES', 'PredictionBuffer', 'Reconciliation']
@@ -0,0 +1,89 @@
+from __future__ import annotations
+from model import Player
+from .protocol import Message, SEQUENCE_MODULUS
+
+class InboundQueue:
+    def __init__(self, max_pending: int = 64):
+        if max_pending <= 0:
+            raise ValueError('max_pending must be positive')
+
+        self._max_pending = max_pending
+        self.clear()
+
+    def clear(self):
+        self._expected: dict[Player, int] = {}
+        self._pending: dict[Player, dict[int, Message]] = {player: {} for player in Player}
+        self._received = 0
+        self._applied = 0
+        self._dropped = 0
+        self._gaps = 0
+        self._skipped = 0
+
+    def reject(self):
+        self._received += 1
+        self._dropped += 1
+
+    def push(self, message: Message) -> list[Message]:
+        self._received += 1
+        player = message.player
+        pending = self._pending[player]
+        distance = (message.sequence - self._expected.setdefault(player, message.sequence)) % SEQUENCE_MODULUS
+
+        if distance >= SEQUENCE_MODULUS // 2 or message.sequence in pending:
+            self._dropped += 1
+            return []
+
+        if distance > 0:
+            if not pending:
+                self._gaps += 1
+            pending[message.sequence] = message
+
+            if len(pending) <= self._max_pending:
+                return []
+
+            self._skip(player)
+            return self._drain(player)
+
+        pending[message.sequence] = message
+        return self._drain(player)
+
+    def _skip(self, player: Player):
+        expected = self._expected[player]
+        nearest = min(self._pending[player], key = lambda sequence: (sequence - expected) % SEQUENCE_MODULUS)
+        self._skipped += (nearest - expected) % SEQUENCE_MODULUS
+        self._expected[player] = nearest
+
+    def _drain(self, player: Player) -> list[Message]:
+        pending = self._pending[player]
+        ready: list[Message] = []
+
+        while self._expected[player] in pending:
+            ready.append(pending.pop(self._expected[player]))
+            self._expected[player] = (self._expected[player] + 1) % SEQUENCE_MODULUS
+
+        self._applied += len(ready)
+        return ready
+
+    @property
+    def get_received(self) -> int:
+        return self._received
+
+    @property
+    def get_applied(self) -> int:
+        return self._applied
+
+    @property
+    def get_dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def get_gaps(self) -> int:
+        return self._gaps
+
+    @property
+    def get_skipped(self) -> int:
+        return self._skipped
+
+    @property
+    def get_pending(self) -> int:
+        return sum(len(pending) for pending in self._pending.values())
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from collections import deque
+from enum import StrEnum, auto
+from .protocol import Message, Opcode
+
+PREDICTED_OPCODES = frozenset({Opcode.select, Opcode.move, Opcode.drop, Opcode.undo})
+
+class Reconciliation(StrEnum):
+    apply = auto()
+    confirmed = auto()
+    settled = auto()
+    rollback = auto()
+
+class PredictionBuffer:
+    def __init__(self):
+        self._pending: deque[Message] = deque()
+        self._accepted: list[Message] = []
+        self._replay: tuple[Message, ...] = ()
+        self._confirmed = 0
+        self._rollbacks = 0
+
+    def clear(self):
+        self._pending.clear()
+        self._accepted.clear()
+        self._replay = ()
+
+    def predict(self, message: Message) -> bool:
+        started = not self._pending
+        self._pending.append(message)
+        return started
+
+    def reconcile(self, message: Message) -> Reconciliation:
+        if not self._pending:
+            return Reconciliation.apply
+
+        if message == self._pending[0]:
+            self._pending.popleft()
+            self._confirmed += 1
+            if self._pending:
+                self._accepted.append(message)
+                return Reconciliation.confirmed
+
+            self._accepted.clear()
+            return Reconciliation.settled
+
+        self._replay = tuple(self._accepted)
+        self._pending.clear()
+        self._accepted.clear()
+        self._rollbacks += 1
+        return Reconciliation.rollback
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def get_replay(self) -> tuple[Message, ...]:
+        return self._replay
+
+    @property
+    def get_confirmed(self) -> int:
+        return self._confirmed
+
+    @property
+    def get_rollbacks(self) -> int:
+        return self._rollbacks
@@ -0,0 +1,126 @@
+from __future__ import annotations
+import base64
+import binascii
+import struct
+from dataclasses import dataclass
+from enum import IntEnum
+from model import (GameState, Location, Piece, PieceType, Player)
+
+PROTOCOL_VERSION = 2
+NONE = 0xFF
+SEQUENCE_MODULUS = 1 << 16
+
+class ProtocolError(ValueError):
+    pass
+
+class Opcode(IntEnum):
+    select = 1
+    move = 2
+    drop = 3
+    undo = 4
+    new_game = 5
+    reject = 6
+
+@dataclass(frozen = True)
+class Message:
+    opcode: Opcode
+    player: Player
+    piece_type: PieceType | None = None
+    source: Location | None = None
+    target: Location | None = None
+    sequence: int = 0
+
+_PLAYER_CODES: dict[Player, int] = {player: index + 1 for index, player in enumerate(Player)}
+_PLAYERS: dict[int, Player] = {code: player for player, code in _PLAYER_CODES.items()}
+_PIECE_CODES: dict[PieceType, int] = {piece_type: index + 1 for index, piece_type in enumerate(PieceType)}
+_PIECE_TYPES: dict[int, PieceType] = {code: piece_type for piece_type, code in _PIECE_CODES.items()}
+
+class MessageCodec:
+    _format = struct.Struct('!6BH')
+
+    def __init__(self, row: int, col: int):
+        if row * col >= NONE:
+            raise ValueError('board is too large for single-byte squares')
+
+        self._row = row
+        self._col = col
+
+    def _square(self, location: Location | None) -> int:
+        if location is None:
+            return NONE
+
+        if not (0 <= location.row < self._row and 0 <= location.col < self._col):
+            raise ProtocolError(f'location off the board: {location}')
+
+        return location.row * self._col + location.col
+
+    def _location(self, square: int) -> Location | None:
+        if square == NONE:
+            return None
+
+        if square >= self._row * self._col:
+            raise ProtocolError(f'square off the board: {square}')
+
+        return Location(square // self._col, square % self._col)
+
+    def encode(self, message: Message) -> bytes:
+        return self._format.pack(
+            PROTOCOL_VERSION,
+            message.opcode,
+            _PLAYER_CODES[message.player],
+            _PIECE_CODES[message.piece_type] if message.piece_type is not None else NONE,
+            self._square(message.source),
+            self._square(message.target),
+            message.sequence % SEQUENCE_MODULUS
+        )
+
+    def decode(self, data: bytes) -> Message:
+        if len(data) != self._format.size:
+            raise ProtocolError(f'expected {self._format.size} bytes, got {len(data)}')
+
+        version, opcode, player, piece, source, target, sequence = self._format.unpack(data)
+        if version != PROTOCOL_VERSION:
+            raise ProtocolError(f'unsupported protocol version: {version}')
+
+        if opcode not in Opcode._value2member_map_:
+            raise ProtocolError(f'unknown opcode: {opcode}')
+
+        if player not in _PLAYERS:
+            raise ProtocolError(f'unknown player: {player}')
+
+        if piece != NONE and piece not in _PIECE_TYPES:
+            raise ProtocolError(f'unknown piece: {piece}')
+
+        return Message(
+            Opcode(opcode),
+            _PLAYERS[player],
+            _PIECE_TYPES[piece] if piece != NONE else None,
+            self._location(source),
+            self._location(target),
+            sequence
+        )
+
+    def encode_text(self, message: Message) -> str:
+        return base64.b64encode(self.encode(message)).decode('ascii')
+
+    def decode_text(self, text: str) -> Message:
+        try:
+            data = base64.b64decode(text.encode('ascii'), validate = True)
+        except (UnicodeEncodeError, binascii.Error) as error:
+            raise ProtocolError(f'malformed message: {text!r}') from error
+
+        return self.decode(data)
+
+def select_message(piece: Piece, player: Player, sequence: int = 0) -> Message:
+    return Message(Opcode.select, player, piece.get_piece_type, piece.get_location, sequence = sequence)
+
+def resolve_piece(message: Message, state: GameState) -> Piece | None:
+    if message.source is not None:
+        piece = state.board_status[message.source.row][message.source.col]
+        if piece is not None and piece.get_piece_type is message.piece_type:
+            return piece
+
+        return None
+
+    captured = state.P1_captured if message.player is Player.p1 else state.P2_captured
+    return next((piece for piece in captured if piece.get_piece_type is message.piece_type), None)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+import queue
+import threading
+from collections.abc import Callable, Iterable
+from typing import Protocol
+
+class ReceivedMessage(Protocol):
+    @property
+    def payload(self) -> str:
+        ...
+
+class Connection(Protocol):
+    def send(self, payload: str):
+        ...
+
+    def recv(self) -> Iterable[ReceivedMessage]:
+        ...
+
+class NetworkWorker:
+    def __init__(self, connection: Connection, on_receive: Callable[[], object] | None = None, poll_interval: float = 0.005):
+        self._connection = connection
+        self._on_receive = on_receive
+        self._poll_interval = poll_interval
+        self._outbox: queue.Queue[str] = queue.Queue()
+        self._inbox: queue.Queue[str] = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target = self._run, name = 'network-worker', daemon = True)
+        self._error: BaseException | None = None
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 1.0):
+        self._stopped.set()
+        if self._thread.is_alive() and threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def send(self, payload: str):
+        self._outbox.put_nowait(payload)
+
+    def receive(self) -> list[str]:
+        payloads: list[str] = []
+        while True:
+            try:
+                payloads.append(self._inbox.get_nowait())
+            except queue.Empty:
+                return payloads
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                self._flush(self._poll_interval)
+                self._poll()
+            self._flush(0)
+        except Exception as error:
+            self._error = error
+            self._stopped.set()
+
+    def _flush(self, timeout: float):
+        try:
+            payload = self._outbox.get(timeout = timeout) if timeout > 0 else self._outbox.get_nowait()
+        except queue.Empty:
+            return
+
+        while True:
+            self._connection.send(payload)
+            try:
+                payload = self._outbox.get_nowait()
+            except queue.Empty:
+                return
+
+    def _poll(self):
+        received = False
+        for message in self._connection.recv():
+            self._inbox.put(message.payload)
+            received = True
+
+        if received and self._on_receive is not None:
+            self._on_receive()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and not self._stopped.is_set()
+
+    @property
+    def get_error(self) -> BaseException | None:
+        return self._error
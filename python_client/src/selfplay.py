@@ -0,0 +1,162 @@
+from __future__ import annotations
+import argparse
+import random
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+from model import (Action, ActionType, ChogiBoard, ChogiPieceInfo, GameStatus, Model, Player)
+
+Policy = Callable[[Model, list[Action], random.Random], Action]
+
+def random_policy(model: Model, legal_actions: list[Action], rng: random.Random) -> Action:
+    return rng.choice(legal_actions)
+
+def capture_policy(model: Model, legal_actions: list[Action], rng: random.Random) -> Action:
+    captures = [
+        action for action in legal_actions
+        if action.action_type is ActionType.move and model.piece_at(action.target) is not None
+    ]
+    return rng.choice(captures or legal_actions)
+
+def first_policy(model: Model, legal_actions: list[Action], rng: random.Random) -> Action:
+    return legal_actions[0]
+
+POLICIES: dict[str, Policy] = {
+    'random': random_policy,
+    'capture': capture_policy,
+    'first': first_policy
+}
+
+@dataclass(frozen = True)
+class GameResult:
+    status: GameStatus
+    winner: Player | None
+    plies: int
+
+@dataclass(frozen = True)
+class SelfPlayReport:
+    games: int
+    elapsed: float
+    total_plies: int
+    p1_wins: int
+    p2_wins: int
+    draws: int
+    unfinished: int
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def average_length(self) -> float:
+        return self.total_plies / self.games if self.games else 0.0
+
+    def rate(self, count: int) -> float:
+        return count / self.games if self.games else 0.0
+
+def play_game(seed: int, p1_policy: str, p2_policy: str, max_plies: int, row: int = 8, col: int = 8) -> GameResult:
+    rng = random.Random(seed)
+    model = Model(ChogiBoard(row, col), ChogiPieceInfo())
+    policies = {Player.p1: POLICIES[p1_policy], Player.p2: POLICIES[p2_policy]}
+    plies = 0
+
+    while plies < max_plies:
+        state = model.state
+        if state.game_status is not GameStatus.ongoing:
+            break
+
+        legal_actions = list(model.legal_actions())
+        if not legal_actions:
+            break
+
+        model.make(policies[state.turn](model, legal_actions, rng))
+        plies += 1
+
+    state = model.state
+    winner = state.turn if state.game_status is GameStatus.has_winner else None
+    return GameResult(state.game_status, winner, plies)
+
+def _play_batch(seeds: list[int], p1_policy: str, p2_policy: str, max_plies: int, row: int, col: int) -> list[GameResult]:
+    return [play_game(seed, p1_policy, p2_policy, max_plies, row, col) for seed in seeds]
+
+def run_selfplay(
+    games: int,
+    p1_policy: str = 'random',
+    p2_policy: str = 'random',
+    max_plies: int = 600,
+    workers: int | None = None,
+    seed: int = 0,
+    chunk_size: int = 8,
+    row: int = 8,
+    col: int = 8
+) -> SelfPlayReport:
+    if games <= 0:
+        raise ValueError('games must be positive')
+
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+
+    if max_plies < 0:
+        raise ValueError('max_plies must not be negative')
+
+    if workers is not None and workers <= 0:
+        raise ValueError('workers must be positive')
+
+    for policy in (p1_policy, p2_policy):
+        if policy not in POLICIES:
+            raise ValueError(f'unknown policy: {policy}')
+
+    layout = [location for location, *_ in ChogiPieceInfo().get_piece_info()]
+    if row <= max(location.row for location in layout) or col <= max(location.col for location in layout):
+        raise ValueError(f'a {row}x{col} board cannot hold the starting position')
+
+    seeds = [seed + index for index in range(games)]
+    batches = [seeds[index:index + chunk_size] for index in range(0, games, chunk_size)]
+    results: list[GameResult] = []
+
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        futures = [executor.submit(_play_batch, batch, p1_policy, p2_policy, max_plies, row, col) for batch in batches]
+        for future in futures:
+            results.extend(future.result())
+    elapsed = perf_counter() - start
+
+    return SelfPlayReport(
+        games = len(results),
+        elapsed = elapsed,
+        total_plies = sum(result.plies for result in results),
+        p1_wins = sum(1 for result in results if result.winner is Player.p1),
+        p2_wins = sum(1 for result in results if result.winner is Player.p2),
+        draws = sum(1 for result in results if result.status is GameStatus.draw),
+        unfinished = sum(1 for result in results if result.status is GameStatus.ongoing)
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Run headless Chogi self-play games.')
+    parser.add_argument('-n', '--games', type = int, default = 100)
+    parser.add_argument('--p1', choices = sorted(POLICIES), default = 'random')
+    parser.add_argument('--p2', choices = sorted(POLICIES), default = 'random')
+    parser.add_argument('--max-plies', type = int, default = 600)
+    parser.add_argument('--workers', type = int, default = None)
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('--chunk-size', type = int, default = 8)
+    parser.add_argument('--rows', type = int, default = 8)
+    parser.add_argument('--cols', type = int, default = 8)
+    args = parser.parse_args()
+
+    report = run_selfplay(
+        args.games, args.p1, args.p2, args.max_plies, args.workers, args.seed, args.chunk_size, args.rows, args.cols
+    )
+
+    print(f'games:          {report.games}')
+    print(f'elapsed:        {report.elapsed:.2f}s')
+    print(f'games/sec:      {report.games_per_second:.2f}')
+    print(f'average length: {report.average_length:.1f} actions')
+    print(f'p1 win rate:    {report.rate(report.p1_wins):.1%}')
+    print(f'p2 win rate:    {report.rate(report.p2_wins):.1%}')
+    print(f'draw rate:      {report.rate(report.draws):.1%}')
+    print(f'unfinished:     {report.rate(report.unfinished):.1%}')
+
+if __name__ == '__main__':
+    main()
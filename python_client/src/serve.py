@@ -0,0 +1,17 @@
+import argparse
+import asyncio
+from server import GameServer
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Host many authoritative Chogi matches over websockets.')
+    parser.add_argument('--host', default = '0.0.0.0')
+    parser.add_argument('--port', type = int, default = 15000)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(GameServer(args.host, args.port).serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
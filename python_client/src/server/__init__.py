@@ -0,0 +1,4 @@
+from .match import Match
+from .app import (GameServer, MESSAGE_SIZE_LIMIT)
+
+__all__ = ['Match', 'GameServer', 'MESSAGE_SIZE_LIMIT']
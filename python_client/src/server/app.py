@@ -0,0 +1,79 @@
+from __future__ import annotations
+import asyncio
+from websockets.asyncio.server import ServerConnection, broadcast, serve
+from websockets.exceptions import ConnectionClosed
+from model import Player
+from .match import Match
+
+MESSAGE_SIZE_LIMIT = 202
+
+class GameServer:
+    def __init__(self, host: str = '0.0.0.0', port: int = 15000, row: int = 8, col: int = 8):
+        self._host = host
+        self._port = port
+        self._row = row
+        self._col = col
+        self._next_match_id = 1
+        self._waiting: Match | None = None
+        self._matches: dict[int, Match] = {}
+        self._connections: dict[int, dict[Player, ServerConnection]] = {}
+        self._started = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._bound_port = port
+
+    async def serve_forever(self):
+        async with serve(self._handle, self._host, self._port, max_size = MESSAGE_SIZE_LIMIT, compression = None) as server:
+            self._bound_port = server.sockets[0].getsockname()[1]
+            self._started.set()
+            await self._stopping.wait()
+
+    def close(self):
+        self._stopping.set()
+
+    async def wait_started(self) -> int:
+        await self._started.wait()
+        return self._bound_port
+
+    def _join(self, connection: ServerConnection) -> tuple[Match, Player]:
+        if self._waiting is None:
+            match = Match(self._next_match_id, self._row, self._col)
+            self._next_match_id += 1
+            self._matches[match.get_match_id] = match
+            self._connections[match.get_match_id] = {Player.p1: connection}
+            self._waiting = match
+            return match, Player.p1
+
+        match = self._waiting
+        self._waiting = None
+        self._connections[match.get_match_id][Player.p2] = connection
+        return match, Player.p2
+
+    async def _leave(self, match: Match):
+        if self._waiting is match:
+            self._waiting = None
+
+        self._matches.pop(match.get_match_id, None)
+        for connection in self._connections.pop(match.get_match_id, {}).values():
+            await connection.close(1001, 'match ended')
+
+    async def _handle(self, connection: ServerConnection):
+        match, player = self._join(connection)
+        player_id = 1 if player is Player.p1 else 2
+
+        try:
+            await connection.send(f'{player_id} ')
+            async for payload in connection:
+                if not isinstance(payload, str):
+                    continue
+
+                accepted = match.apply(player, payload)
+                if accepted is not None:
+                    broadcast(self._connections.get(match.get_match_id, {}).values(), f'{player_id} {accepted}')
+        except ConnectionClosed:
+            pass
+        finally:
+            await self._leave(match)
+
+    @property
+    def get_matches(self) -> dict[int, Match]:
+        return self._matches
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from model import (ChogiBoard, ChogiPieceInfo, GameStatus, Model, Player)
+from network import (MessageCodec, Message, Opcode, ProtocolError, resolve_piece)
+
+class Match:
+    def __init__(self, match_id: int, row: int = 8, col: int = 8):
+        self._match_id = match_id
+        self._model = Model(ChogiBoard(row, col), ChogiPieceInfo())
+        self._codec = MessageCodec(row, col)
+        self._accepted = 0
+        self._rejected = 0
+        self._malformed = 0
+
+    def apply(self, player: Player, payload: str) -> str | None:
+        try:
+            message = self._codec.decode_text(payload)
+        except ProtocolError:
+            self._malformed += 1
+            return None
+
+        if message.player is player and self._apply(message):
+            self._accepted += 1
+            return payload
+
+        self._rejected += 1
+        return self._codec.encode_text(Message(Opcode.reject, player, sequence = message.sequence))
+
+    def _apply(self, message: Message) -> bool:
+        model = self._model
+        state = model.state
+
+        match message.opcode:
+            case Opcode.select:
+                piece = resolve_piece(message, state)
+                if piece is not None:
+                    model.piece_select(piece, message.player)
+                return model.state.version != state.version
+            case Opcode.move | Opcode.drop:
+                if message.target is None:
+                    return False
+
+                if message.opcode is Opcode.move:
+                    model.move(message.target, message.player)
+                else:
+                    model.drop(message.target, message.player)
+                return model.state.version != state.version
+            case Opcode.undo:
+                model.undo(message.player)
+                return model.state.version != state.version
+            case Opcode.new_game:
+                if state.game_status is GameStatus.ongoing:
+                    return False
+
+                model.new_game()
+                return True
+            case _:
+                return False
+
+    @property
+    def get_match_id(self) -> int:
+        return self._match_id
+
+    @property
+    def get_model(self) -> Model:
+        return self._model
+
+    @property
+    def get_accepted(self) -> int:
+        return self._accepted
+
+    @property
+    def get_rejected(self) -> int:
+        return self._rejected
+
+    @property
+    def get_malformed(self) -> int:
+        return self._malformed
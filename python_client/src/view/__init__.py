@@ -1,4 +1,5 @@
 from .view import PygameView, View
-from .observers import GameStateChangeObserver
+from .observers import GameStateChangeObserver, LegalActionsChangeObserver, PredictionObserver, WakeObserver
+from .assets import FontRegistry, SpriteCache, TextCache
 
-__all__ = ['PygameView', 'View', 'GameStateChangeObserver']
\ No newline at end of file
+__all__ = ['PygameView', 'View', 'GameStateChangeObserver', 'LegalActionsChangeObserver', 'PredictionObserver', 'WakeObserver', 'SpriteCache', 'FontRegistry', 'TextCache']
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from collections import OrderedDict
+from pathlib import Path
+import pygame
+
+from model import PieceType, Player
+
+SPRITE_DIR = Path(__file__).resolve().parent.parent / 'sprites'
+
+class SpriteCache:
+    def __init__(self, directory: Path = SPRITE_DIR):
+        self._directory = directory
+        self._sources: dict[str, pygame.Surface] = {}
+        self._variants: dict[tuple[str, int, int], pygame.Surface] = {}
+        self._tile_width = 0
+        self._loads = 0
+
+    def set_tile_width(self, tile_width: int):
+        if tile_width != self._tile_width:
+            self._variants.clear()
+            self._tile_width = tile_width
+
+    def source(self, asset: str) -> pygame.Surface:
+        surface = self._sources.get(asset)
+        if surface is None:
+            surface = pygame.image.load(self._directory / f'{asset}.png')
+            if pygame.display.get_init() and pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            self._sources[asset] = surface
+            self._loads += 1
+        return surface
+
+    def get(self, asset: str, size: int, orientation: int = 0) -> pygame.Surface:
+        key = (asset, size, orientation)
+        surface = self._variants.get(key)
+        if surface is None:
+            surface = pygame.transform.scale(self.source(asset), (size, size))
+            if orientation:
+                surface = pygame.transform.rotate(surface, orientation)
+            self._variants[key] = surface
+        return surface
+
+    def piece(self, piece_type: PieceType, player: Player, size: int) -> pygame.Surface:
+        return self.get(piece_type.value, size, 180 if player is Player.p2 else 0)
+
+    def tile(self, highlight: str, size: int) -> pygame.Surface:
+        return self.get(f'{highlight}_tile' if highlight else 'tile', size)
+
+    def __len__(self) -> int:
+        return len(self._variants)
+
+    @property
+    def get_tile_width(self) -> int:
+        return self._tile_width
+
+    @property
+    def get_loads(self) -> int:
+        return self._loads
+
+class FontRegistry:
+    def __init__(self):
+        self._fonts: dict[tuple[str, int], pygame.font.Font] = {}
+
+    def get(self, name: str, size: int) -> pygame.font.Font:
+        font = self._fonts.get((name, size))
+        if font is None:
+            font = pygame.font.SysFont(name, size)
+            self._fonts[(name, size)] = font
+        return font
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+class TextCache:
+    def __init__(self, fonts: FontRegistry, capacity: int = 64):
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+
+        self._fonts = fonts
+        self._capacity = capacity
+        self._surfaces: OrderedDict[tuple[str, str, int, str], pygame.Surface] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def render(self, text: str, font: str, size: int, color: str) -> pygame.Surface:
+        key = (text, font, size, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self._hits += 1
+            return surface
+
+        surface = self._fonts.get(font, size).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._capacity:
+            self._surfaces.popitem(last = False)
+        self._misses += 1
+        return surface
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    @property
+    def get_hits(self) -> int:
+        return self._hits
+
+    @property
+    def get_misses(self) -> int:
+        return self._misses
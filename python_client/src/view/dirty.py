@@ -0,0 +1,31 @@
+from __future__ import annotations
+from collections.abc import Hashable, Mapping
+import pygame
+
+Region = tuple[Hashable, pygame.Rect]
+
+class DirtyRegions:
+    def __init__(self):
+        self._previous: dict[Hashable, Region] = {}
+
+    def reset(self):
+        self._previous = {}
+
+    def diff(self, regions: Mapping[Hashable, Region]) -> list[pygame.Rect]:
+        dirty: list[pygame.Rect] = []
+
+        for key, (signature, rect) in regions.items():
+            previous = self._previous.get(key)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[0] != signature or previous[1] != rect:
+                dirty.append(rect)
+                if previous[1] != rect:
+                    dirty.append(previous[1])
+
+        for key, (_, rect) in self._previous.items():
+            if key not in regions:
+                dirty.append(rect)
+
+        self._previous = dict(regions)
+        return dirty
@@ -0,0 +1,63 @@
+from __future__ import annotations
+from collections.abc import Iterable
+from dataclasses import dataclass
+from model import Action, ActionType, GameState, Location, Piece
+
+@dataclass(frozen = True)
+class Highlights:
+    destinations: frozenset[Location] = frozenset()
+    captures: frozenset[Location] = frozenset()
+    drops: frozenset[Location] = frozenset()
+
+    @property
+    def get_tiles(self) -> dict[Location, str]:
+        tiles = {location: 'move' for location in self.destinations | self.drops}
+        tiles.update((location, 'capture') for location in self.captures)
+        return tiles
+
+class HighlightCache:
+    def __init__(self):
+        self._builds = 0
+        self.invalidate()
+
+    def invalidate(self):
+        self._key: tuple[int, Piece | None] | None = None
+        self._highlights = Highlights()
+        self._tiles: dict[Location, str] = {}
+
+    def get(self, state: GameState, legal_actions: Iterable[Action]) -> Highlights:
+        key = (state.version, state.selected_piece)
+        if key != self._key:
+            self._highlights = self._build(state, legal_actions)
+            self._tiles = self._highlights.get_tiles
+            self._key = key
+            self._builds += 1
+        return self._highlights
+
+    def tiles(self, state: GameState, legal_actions: Iterable[Action]) -> dict[Location, str]:
+        self.get(state, legal_actions)
+        return self._tiles
+
+    def _build(self, state: GameState, legal_actions: Iterable[Action]) -> Highlights:
+        piece = state.selected_piece
+        if piece is None:
+            return Highlights()
+
+        source = piece.get_location
+        if source is None:
+            return Highlights(drops = frozenset(
+                action.target for action in legal_actions
+                if action.action_type is ActionType.drop and action.piece_type is piece.get_piece_type
+            ))
+
+        destinations: set[Location] = set()
+        captures: set[Location] = set()
+        for action in legal_actions:
+            if action.action_type is ActionType.move and action.source == source:
+                target = action.target
+                (destinations if state.board_status[target.row][target.col] is None else captures).add(target)
+        return Highlights(frozenset(destinations), frozenset(captures))
+
+    @property
+    def get_builds(self) -> int:
+        return self._builds
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Protocol
-from model import GameState, Location, Player, Piece
+from model import GameState, Location, Player, Piece, Action
 
 
 class NewGameObserver(Protocol):
@@ -23,10 +23,28 @@ class UndoObserver(Protocol):
     def on_undo(self, player: Player):
         ...
 
+class PredictionObserver(Protocol):
+    def on_prediction_start(self):
+        ...
+
+    def on_prediction_settled(self):
+        ...
+
+    def on_prediction_rollback(self):
+        ...
+
+class WakeObserver(Protocol):
+    def on_wake(self):
+        ...
+
 class GameStateChangeObserver(Protocol):
     def on_state_change(self, state: GameState):
         ...
 
+class LegalActionsChangeObserver(Protocol):
+    def on_legal_actions_change(self, legal_actions: list[Action]):
+        ...
+
 class View(Protocol):
     def run(self):
         ...
@@ -34,6 +52,9 @@ class View(Protocol):
     def on_state_change(self, state: GameState):
         ...
 
+    def on_legal_actions_change(self, legal_actions: list[Action]):
+        ...
+
     def register_new_game_observer(self, observer: NewGameObserver):
         ...
     
@@ -48,3 +69,12 @@ class View(Protocol):
     
     def register_undo_observer(self, observer: UndoObserver):
         ...
+
+    def register_prediction_observer(self, observer: PredictionObserver):
+        ...
+
+    def register_wake_observer(self, observer: WakeObserver):
+        ...
+
+    def wake(self):
+        ...
@@ -1,83 +1,69 @@
 import pygame, sys
+from collections.abc import Hashable
+from dataclasses import replace
 
 from model import (
-    GameState, GameStatus, Player, Location, Piece, PieceType, Trait
+    GameState, GameStatus, Player, Location, Piece, Action, BoardStatus
 )
 from .observers import (
-    NewGameObserver, PieceSelectObserver, MoveObserver, DropObserver, UndoObserver, View
+    NewGameObserver, PieceSelectObserver, MoveObserver, DropObserver, UndoObserver, PredictionObserver, WakeObserver, View
 )
+from .assets import FontRegistry, SpriteCache, TextCache
+from .dirty import DirtyRegions, Region
+from .highlights import HighlightCache
 
-from cs150241project_networking import CS150241ProjectNetworking
+from network import (
+    InboundQueue, MessageCodec, Message, NetworkWorker, Opcode, PREDICTED_OPCODES, PredictionBuffer, ProtocolError, Reconciliation,
+    resolve_piece, select_message
+)
+
+NETWORK_EVENT = pygame.event.custom_type()
+WAKE_EVENT = pygame.event.custom_type()
+FRAME_MS = 1000 // 60
 
 class TextView:
-    def __init__(self, x: int, y: int, game_status: GameStatus, turn: Player, moves_left: int, player_id: int):
+    def __init__(self, x: int, y: int, game_status: GameStatus, turn: Player, moves_left: int, player_id: int, texts: TextCache):
         self._x = x
         self._y = y
         self._game_status = game_status
         self._turn = turn
         self._moves_left = moves_left
         self._player_id = player_id
+        self._texts = texts
 
-    def render(self, screen: pygame.Surface):
-        font = pygame.font.SysFont('arialrounded', 28)
-        font_color = '#F1E7D8'
-
-        subtext_font1 = pygame.font.SysFont('arialrounded', 18)
-        subtext_font2 = pygame.font.SysFont('arialrounded', 12)
+    def _blit(self, screen: pygame.Surface, text: str, size: int, center: tuple[int, int]):
+        text_obj = self._texts.render(text, 'arialrounded', size, '#F1E7D8')
+        text_rect = text_obj.get_rect()
+        text_rect.center = center
+        screen.blit(text_obj, text_rect)
 
+    def render(self, screen: pygame.Surface):
         match self._game_status:
             case GameStatus.ongoing:
                 text = 'Your Turn' if Player[f'p{self._player_id}'] is self._turn else 'Opponent\'s Turn'
-                text_obj = font.render(text, True, font_color)
-                text_rect = text_obj.get_rect()
-                text_rect.center = (self._x, self._y)
-                screen.blit(text_obj, text_rect)
+                self._blit(screen, text, 28, (self._x, self._y))
 
                 if Player[f'p{self._player_id}'] is self._turn:
-                    subtext_obj = subtext_font1.render(f'Moves left: {self._moves_left}', True, font_color)
-                    subtext_rect = subtext_obj.get_rect()
-                    subtext_rect.center = (self._x, self._y + 30)
-                    screen.blit(subtext_obj, subtext_rect)
-
-                player_text_obj = subtext_font1.render(f'You are Player {self._player_id}', True, font_color)
-                player_text_rect = player_text_obj.get_rect()
-                player_text_rect.center = (self._x, 11 * self._y)
-                screen.blit(player_text_obj, player_text_rect)
+                    self._blit(screen, f'Moves left: {self._moves_left}', 18, (self._x, self._y + 30))
 
-                inst_text_obj = subtext_font2.render('Press \'U\' to undo move once (chick piece only)', True, font_color)
-                inst_text_rect = inst_text_obj.get_rect()
-                inst_text_rect.center = (self._x, 11 * self._y + 30)
-                screen.blit(inst_text_obj, inst_text_rect)
+                self._blit(screen, f'You are Player {self._player_id}', 18, (self._x, 11 * self._y))
+                self._blit(screen, 'Press \'U\' to undo move once (chick piece only)', 12, (self._x, 11 * self._y + 30))
 
             case GameStatus.has_winner:
                 text = 'You win!' if Player[f'p{self._player_id}'] is self._turn else 'You lose'
-                text_obj = font.render(text, True, font_color)
-                text_rect = text_obj.get_rect()
-                text_rect.center = (self._x, self._y)
-                screen.blit(text_obj, text_rect)
-
-                inst_text_obj = subtext_font1.render('Press \'R\' to play again', True, font_color)
-                inst_text_rect = inst_text_obj.get_rect()
-                inst_text_rect.center = (self._x, 11 * self._y)
-                screen.blit(inst_text_obj, inst_text_rect)
+                self._blit(screen, text, 28, (self._x, self._y))
+                self._blit(screen, 'Press \'R\' to play again', 18, (self._x, 11 * self._y))
 
             case GameStatus.draw:
-                text = 'Draw'
-                text_obj = font.render(text, True, font_color)
-                text_rect = text_obj.get_rect()
-                text_rect.center = (self._x, self._y)
-                screen.blit(text_obj, text_rect)
-
-                inst_text_obj = subtext_font1.render('Press \'R\' to play again', True, font_color)
-                inst_text_rect = inst_text_obj.get_rect()
-                inst_text_rect.center = (self._x, 11 * self._y)
-                screen.blit(inst_text_obj, inst_text_rect)
+                self._blit(screen, 'Draw', 28, (self._x, self._y))
+                self._blit(screen, 'Press \'R\' to play again', 18, (self._x, 11 * self._y))
 
 class PieceView:
-    def __init__(self, x: int, y: int, width: int, piece: Piece):        
+    def __init__(self, x: int, y: int, width: int, piece: Piece, sprites: SpriteCache):
         self._x = x
         self._y = y
         self._width = width
+        self._sprites = sprites
 
         self._piece = piece
         self.piece_info()
@@ -90,26 +76,11 @@ class PieceView:
         self._player = self._piece.get_player
 
     def render(self, screen: pygame.Surface):
-        piece_icon = None
-
-        match self._piece_type:
-            case PieceType.chick:
-                piece_icon = pygame.image.load(r'src\sprites\chick.png')
-            case PieceType.elephant:
-                piece_icon = pygame.image.load(r'src\sprites\elephant.png')
-            case PieceType.giraffe:
-                piece_icon = pygame.image.load(r'src\sprites\giraffe.png')
-            case PieceType.monkey:
-                piece_icon = pygame.image.load(r'src\sprites\monkey.png')
-            case PieceType.lion:
-                piece_icon = pygame.image.load(r'src\sprites\lion.png')
-
-        piece_icon = pygame.transform.scale(piece_icon, (self._width, self._width))
-        
-        if self._player is Player.p2:
-            piece_icon = pygame.transform.rotate(piece_icon, 180)
+        screen.blit(self._sprites.piece(self._piece_type, self._player, self._width), (self._x, self._y))
 
-        screen.blit(piece_icon, (self._x, self._y))
+    @property
+    def get_rect(self) -> pygame.Rect:
+        return pygame.Rect(self._x, self._y, self._width, self._width)
     
     def is_on_piece(self, mx: int, my: int) -> bool:
         return (mx in range (self._x, self._x + self._width) and my in range (self._y, self._y + self._width))
@@ -118,26 +89,39 @@ class PieceView:
     def get_piece(self):
         return self._piece
 
+class HandTray:
+    def __init__(self, x: int, y: int, stride: int, width: int, pieces: list[PieceView]):
+        self._x = x
+        self._y = y
+        self._stride = stride
+        self._width = width
+        self._pieces = pieces
+
+    def piece_at(self, mx: int, my: int) -> PieceView | None:
+        if not (self._y <= my < self._y + self._width and mx >= self._x):
+            return None
+
+        index, offset = divmod(mx - self._x, self._stride)
+        if index < len(self._pieces) and offset < self._width:
+            return self._pieces[index]
+        return None
+
 class BoardView:
-    def __init__(self, row: int, col: int):
+    def __init__(self, row: int, col: int, sprites: SpriteCache):
         self._row = row
         self._col = col
+        self._sprites = sprites
 
-    def _render_tile(self, x: int, y: int, highlight: str):
-        tile = None
-
-        match highlight:
-            case 'select':
-                tile = pygame.image.load(r'src\sprites\select_tile.png')
-            case 'move':
-                tile = pygame.image.load(r'src\sprites\move_tile.png')
-            case 'capture':
-                tile = pygame.image.load(r'src\sprites\capture_tile.png')            
-            case _:
-                tile = pygame.image.load(r'src\sprites\tile.png')
-        
-        tile = pygame.transform.scale(tile, (self._tile_width, self._tile_width))
-        self._screen.blit(tile, (x, y))
+    def _render_tile(self, screen: pygame.Surface, x: int, y: int, highlight: str):
+        screen.blit(self._sprites.tile(highlight, self._tile_width), (x, y))
+
+    def get_tile_rect(self, location: Location) -> pygame.Rect:
+        return pygame.Rect(
+            self._x + location.col * self._tile_width, self._y + location.row * self._tile_width, self._tile_width, self._tile_width
+        )
+
+    def render_tile(self, screen: pygame.Surface, location: Location, highlight: str):
+        self._render_tile(screen, self._x + location.col * self._tile_width, self._y + location.row * self._tile_width, highlight)
 
     def get_tile_coords(self) -> list[tuple[int, int]]:
         coords: list[tuple[int, int]] = []
@@ -152,20 +136,16 @@ class BoardView:
         return (mx in range (x, x + self._tile_width) and my in range(y, y + self._tile_width))
 
     def mouse_on_board(self, mx: int, my: int) -> bool:
-        for xi, yi in self.get_tile_coords():
-            if self.mouse_on_tile(xi, yi, mx, my):
-                return True
-        
-        return False
+        return self.get_action_location(mx, my) is not None
 
     def render_board(self, screen: pygame.Surface, x: int, y: int, tile_width: int):
-        self._screen = screen
         self._x = x
         self._y = y
         self._tile_width = tile_width
+        self._sprites.set_tile_width(tile_width)
 
         for xi, yi in self.get_tile_coords():
-            self._render_tile(xi, yi, '')
+            self._render_tile(screen, xi, yi, '')
 
         board_width = 10
         pygame.draw.rect(screen, '#AA8E5E', (
@@ -176,79 +156,19 @@ class BoardView:
         ), 10)
 
     def get_action_location(self, mx: int, my: int) -> Location | None:
-        for i in range(self._row):
-            for j in range(self._col):
-                x = self._x + j * self._tile_width
-                y = self._y + i * self._tile_width
-                if self.mouse_on_tile(x, y, mx, my):
-                    return Location(row = i, col = j)
-
-    def render_select_tile(self, mx: int, my: int, player: Player, board_status: list[list[Piece | None]]):
-        for i in range(self._row):
-            for j in range(self._col):
-                x = self._x + j * self._tile_width
-                y = self._y + i * self._tile_width
-                if self.mouse_on_tile(x, y, mx, my):
-                    piece: None | Piece = board_status[i][j]
-                    if piece is not None:
-                        if piece.get_player is player:
-                            self._render_tile(x, y, 'select')
-    
-    def get_piece_destinations(self, piece: Piece, board_status: list[list[Piece | None]]) -> list[Location]:
-        possible_destinations: list[Location] = []
-
-        for delta_x, delta_y in piece.get_moves:
-            if piece.get_location is not None:
-                new_row = piece.get_location.row - delta_y
-                new_col = piece.get_location.col + delta_x
-                if new_row in range(self._row) and new_col in range(self._col):
-                    target_piece: Piece | None = board_status[new_row][new_col]
-                    if Trait.protected in piece.get_traits:
-                        if target_piece is None:
-                            possible_destinations.append(Location(row = new_row, col = new_col))
-                    else:
-                        if target_piece is None:
-                            possible_destinations.append(Location(row = new_row, col = new_col))
-                        else:
-                            if piece.get_player is not target_piece.get_player:
-                                possible_destinations.append(Location(row = new_row, col = new_col))
-        
-        return possible_destinations
-
-    def render_destination_tiles(self, piece: Piece, board_status: list[list[Piece | None]]):
-        possible_destinations = self.get_piece_destinations(piece, board_status)
-            
-        for destination in possible_destinations:
-            x = self._x + destination.col * self._tile_width
-            y = self._y + destination.row * self._tile_width
-            if board_status[destination.row][destination.col] is None:
-                self._render_tile(x, y, 'move')
-            else:
-                self._render_tile(x, y, 'capture')
-    
-    def get_drop_locations(self, piece: Piece, board_status: list[list[Piece | None]]) -> list[Location]:
-        protected_paths: list[Location] = []
-        for row in board_status:
-            for p in row:
-                if p is not None and p.get_traits:
-                    if Trait.protected in p.get_traits and piece.get_player is not p.get_player:
-                        protected_paths += self.get_piece_destinations(p, board_status)
-        
-        drop_locations: list[Location] = []
-        for i in range(self._row):
-            for j in range(self._col):
-                if board_status[i][j] is None and Location(row = i, col = j) not in protected_paths:
-                    drop_locations.append(Location(row = i, col = j))
-
-        return drop_locations
-
-    def render_drop_tiles(self, piece: Piece, board_status: list[list[Piece | None]]):
-        for i in range(self._row):
-            for j in range(self._col):
-                if Location(row = i, col = j) in self.get_drop_locations(piece, board_status):
-                    x = self._x + j * self._tile_width
-                    y = self._y + i * self._tile_width
-                    self._render_tile(x, y, 'move')
+        dx, dy = mx - self._x, my - self._y
+        if 0 <= dx < self._col * self._tile_width and 0 <= dy < self._row * self._tile_width:
+            return Location(row = dy // self._tile_width, col = dx // self._tile_width)
+        return None
+
+    def get_select_tile(self, mx: int, my: int, player: Player, board_status: BoardStatus) -> dict[Location, str]:
+        location = self.get_action_location(mx, my)
+        if location is not None:
+            piece: None | Piece = board_status[location.row][location.col]
+            if piece is not None and piece.get_player is player:
+                return {location: 'select'}
+
+        return {}
     
     @property
     def get_row(self):
@@ -271,35 +191,96 @@ class BoardView:
         return self._tile_width
 
 class PygameView(View):
-    def __init__(self, state: GameState):
-        self.init_network()
+    def __init__(self, state: GameState, networked: bool = True):
+        if networked:
+            self.init_network()
+        else:
+            self.init_local()
         self.on_state_change(state)
 
         self._width: int = 720
         self._height: int = 720
         
-        self._board: BoardView = BoardView(8, 8)
+        self._sprites: SpriteCache = SpriteCache()
+        self._texts: TextCache = TextCache(FontRegistry())
+        self._board: BoardView = BoardView(8, 8, self._sprites)
+        self._codec: MessageCodec = MessageCodec(self._board.get_row, self._board.get_col)
         self._pieces: list[PieceView] = []
+        self._board_pieces: dict[Location, PieceView] = {}
+        self._trays: list[HandTray] = []
+        self._highlights: dict[Location, str] = {}
+        self._dirty: DirtyRegions = DirtyRegions()
         self._new_game_observers: list[NewGameObserver] = []
         self._piece_select_observers: list[PieceSelectObserver] = []
         self._move_observers: list[MoveObserver] = []
         self._drop_observers: list[DropObserver] = []
         self._undo_observers: list[UndoObserver] = []
+        self._prediction_observers: list[PredictionObserver] = []
+        self._wake_observers: list[WakeObserver] = []
+        self._legal_actions: list[Action] = []
+        self._highlight_cache: HighlightCache = HighlightCache()
 
     def on_state_change(self, state: GameState):
         self._state = state
         self._game_status: GameStatus = state.game_status
-        self._board_status: list[list[Piece | None]] = state.board_status
+        self._board_status: BoardStatus = state.board_status
         self._turn: Player = state.turn
         self._moves_left = state.moves_left
         self._selected_piece: Piece | None = state.selected_piece
-        self._P1_captured: list[Piece] = state.P1_captured
-        self._P2_captured: list[Piece] = state.P2_captured
+        self._P1_captured: tuple[Piece, ...] = state.P1_captured
+        self._P2_captured: tuple[Piece, ...] = state.P2_captured
+
+    def on_legal_actions_change(self, legal_actions: list[Action]):
+        self._legal_actions = legal_actions
+        self._highlight_cache.invalidate()
 
     def init_network(self):
+        from cs150241project_networking import CS150241ProjectNetworking
+
         self._network = CS150241ProjectNetworking.connect('localhost', 15000)
-        self._latest_message = None
+        self._worker = NetworkWorker(self._network, self._post_network_event)
+        self._worker.start()
+        self._inbound = InboundQueue()
+        self._prediction = PredictionBuffer()
+        self._sequence = 0
         self._player_id = self._network.player_id
+        self._player = Player[f'p{self._player_id}']
+
+    def init_local(self):
+        self._worker: NetworkWorker | None = None
+        self._inbound = InboundQueue()
+        self._prediction = PredictionBuffer()
+        self._sequence = 0
+        self._player_id = 1
+        self._player = Player.p1
+
+    def _send(self, message: Message):
+        if self._worker is None:
+            if message.opcode in PREDICTED_OPCODES:
+                self._dispatch(message)
+            return
+
+        message = replace(message, sequence = self._sequence)
+        self._sequence += 1
+        self._worker.send(self._codec.encode_text(message))
+
+        if message.opcode in PREDICTED_OPCODES:
+            if self._prediction.predict(message):
+                for observer in self._prediction_observers:
+                    observer.on_prediction_start()
+            self._dispatch(message)
+
+    def _post_network_event(self):
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(NETWORK_EVENT))
+
+    def wake(self):
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(WAKE_EVENT))
+
+    def _on_wake(self):
+        for observer in self._wake_observers:
+            observer.on_wake()
 
     def run(self):
         pygame.init()
@@ -320,167 +301,217 @@ class PygameView(View):
         pygame.display.set_caption(f'Chogi v150: Player {self._player_id}')
 
         self._screen = screen
+        self._background = pygame.Surface((width, height)).convert()
+        self._background.fill("#99BE8F")
+        self._board.render_board(self._background, board_x, board_y, tile_width)
+
+        p2_tray_y = board_y - piece_width - tile_width // 3
+        p1_tray_y = board_y + board_height + tile_width // 3
+        self._hud_rects = (pygame.Rect(0, 0, width, p2_tray_y), pygame.Rect(0, p1_tray_y + piece_width, width, height - p1_tray_y - piece_width))
 
-        clock = pygame.time.Clock()
+        self._receiver()
+        self._on_wake()
 
         sel_mx, sel_my = -1, -1
+        full_redraw = True
+        rendered_state: GameState | None = None
+        rendered_highlights: dict[Location, str] | None = None
 
         while True:
-            screen.fill("#99BE8F")
-
-            TextView(width // 2, height // 12, self._game_status, self._turn, self._moves_left, self._player_id).render(self._screen)
-
+            events = self._wait_events(FRAME_MS)
             mx, my = pygame.mouse.get_pos()
 
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
+                    if self._worker is not None:
+                        self._worker.stop()
                     pygame.quit()
                     sys.exit()
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    full_redraw = True
+                if event.type == NETWORK_EVENT:
+                    self._receiver()
+                if event.type == WAKE_EVENT:
+                    self._on_wake()
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:
                         if self._game_status is GameStatus.ongoing:
                             if self._board.mouse_on_board(mx, my):
                                 if self._selected_piece is not None:
                                     destination = self._board.get_action_location(mx, my)
-                                    destination_str = str((destination.row, destination.col)) if destination is not None else 'None'
-                                    if self._selected_piece.get_location is not None:
-                                        move_message = 'move#' + destination_str + f'#p{self._player_id}'
-                                        self._network.send(move_message)
-                                    else:
-                                        drop_message = 'drop#' + destination_str + f'#p{self._player_id}'
-                                        self._network.send(drop_message)
+                                    if destination is not None:
+                                        opcode = Opcode.move if self._selected_piece.get_location is not None else Opcode.drop
+                                        self._send(Message(opcode, self._player, target = destination))
                                 else:
                                     sel_mx, sel_my = mx, my
                                     selected_piece = self._select_piece(sel_mx, sel_my)
                                     if selected_piece is not None:
-                                        select_message = 'select#'
-                                        piece_str = str((
-                                            str((selected_piece.get_location.row, selected_piece.get_location.col)) if selected_piece.get_location is not None else 'None',
-                                            str(selected_piece.get_piece_type),
-                                            str([str(trait) for trait in selected_piece.get_traits]),
-                                            str(selected_piece.get_moves),
-                                            str(selected_piece.get_player)
-                                        ))
-                                        select_message += (piece_str + f'#p{self._player_id}')
-                                        self._network.send(select_message)
-                                    else:
-                                        self._network.send(f'select#None#p{self._player_id}')
+                                        self._send(select_message(selected_piece, self._player))
                             else:
                                 sel_mx, sel_my = mx, my
                                 selected_piece = self._select_piece(sel_mx, sel_my)
                                 if selected_piece is not None:
-                                    select_message = 'select#'
-                                    piece_str = str((
-                                        'None',
-                                        str(selected_piece.get_piece_type),
-                                        str([str(trait) for trait in selected_piece.get_traits]),
-                                        str(selected_piece.get_moves),
-                                        str(selected_piece.get_player)
-                                    ))         
-                                    select_message += (piece_str + f'#p{self._player_id}')
-                                    self._network.send(select_message)
+                                    self._send(select_message(selected_piece, self._player))
 
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
                         if self._game_status is not GameStatus.ongoing:
                             self._new_game()
-                            new_game_message = f'new_game#None#p{self._player_id}'
-                            self._network.send(new_game_message)
+                            self._send(Message(Opcode.new_game, self._player))
                     elif event.key == pygame.K_u:
                         if self._game_status is GameStatus.ongoing:
-                            undo_message = f'undo#None#p{self._player_id}'
-                            self._network.send(undo_message)
-
-            self._board.render_board(screen, board_x, board_y, tile_width)
-
-            self._receiver()
+                            self._send(Message(Opcode.undo, self._player))
+
+            state_changed = self._state is not rendered_state
+            if state_changed:
+                self._pieces = []
+                self._board_pieces = {}
+                self._trays = []
+                self._set_active_pieces(board_x, board_y, piece_width)
+                self._set_captured_pieces(
+                    (width - len(self._P1_captured) * tile_width) // 2, p1_tray_y, piece_width, self._P1_captured
+                )
+                self._set_captured_pieces(
+                    (width - len(self._P2_captured) * tile_width) // 2, p2_tray_y, piece_width, self._P2_captured
+                )
+                rendered_state = self._state
 
             if self._game_status is GameStatus.ongoing and Player[f'p{self._player_id}'] is self._turn:
-                self._render_highlights(mx, my, sel_mx, sel_my)
+                self._highlights = self._get_highlights(mx, my, sel_mx, sel_my)
             else:
+                self._highlights = {}
                 pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
-            self._pieces = []
+            if full_redraw:
+                self._dirty.diff(self._get_regions())
+                self._redraw([screen.get_rect()])
+                pygame.display.flip()
+                full_redraw = False
+            elif state_changed or self._highlights != rendered_highlights:
+                dirty = self._dirty.diff(self._get_regions())
+                if dirty:
+                    self._redraw(dirty)
+                    pygame.display.update(dirty)
+            rendered_highlights = self._highlights
+
+    def _wait_events(self, timeout: int) -> list[pygame.event.Event]:
+        first = pygame.event.wait(timeout)
+        events = pygame.event.get()
+        if first.type != pygame.NOEVENT:
+            events.insert(0, first)
+        return events
+
+    def _get_regions(self) -> dict[Hashable, Region]:
+        regions: dict[Hashable, Region] = {}
+
+        for i, row in enumerate(self._board_status):
+            for j, piece in enumerate(row):
+                location = Location(row = i, col = j)
+                occupant = None if piece is None else (piece.get_piece_type, piece.get_player)
+                regions[location] = ((occupant, self._highlights.get(location, '')), self._board.get_tile_rect(location))
+
+        for piece_view in self._pieces:
+            piece = piece_view.get_piece
+            if piece.get_location is None:
+                regions[(piece.get_player, piece_view.get_rect.topleft)] = ((piece.get_piece_type, piece.get_player), piece_view.get_rect)
+
+        hud = (self._game_status, self._turn, self._moves_left)
+        for index, rect in enumerate(self._hud_rects):
+            regions[index] = (hud, rect)
+
+        return regions
+
+    def _redraw(self, dirty: list[pygame.Rect]):
+        for rect in dirty:
+            self._screen.blit(self._background, rect, rect)
+
+        for location, highlight in self._highlights.items():
+            if self._board.get_tile_rect(location).collidelist(dirty) != -1:
+                self._board.render_tile(self._screen, location, highlight)
 
-            self._set_active_pieces(board_x, board_y, piece_width)
-            self._set_captured_pieces(
-                (width - len(self._P1_captured) * tile_width) // 2, board_y + board_height + tile_width // 3, piece_width, self._P1_captured
-            )
-            self._set_captured_pieces(
-                (width - len(self._P2_captured) * tile_width) // 2, board_y - piece_width - tile_width // 3, piece_width, self._P2_captured
-            )
-
-            self._render_pieces()
-            pygame.display.flip()
+        for piece in self._pieces:
+            if piece.get_rect.collidelist(dirty) != -1:
+                piece.render(self._screen)
 
-            clock.tick(60)
+        if any(rect.collidelist(dirty) != -1 for rect in self._hud_rects):
+            TextView(
+                self._width // 2, self._height // 12, self._game_status, self._turn, self._moves_left, self._player_id, self._texts
+            ).render(self._screen)
     
-    def _render_highlights(self, mx: int, my: int, sel_mx: int, sel_my: int):
+    def _get_highlights(self, mx: int, my: int, sel_mx: int, sel_my: int) -> dict[Location, str]:
         self._update_cursor(mx, my)
         if self._selected_piece is not None:
+            tiles = self._highlight_cache.tiles(self._state, self._legal_actions)
             if self._selected_piece.get_location is not None:
-                self._board.render_select_tile(sel_mx, sel_my, self._turn, self._board_status)
-                self._board.render_destination_tiles(self._selected_piece, self._board_status)
+                return self._board.get_select_tile(sel_mx, sel_my, self._turn, self._board_status) | tiles
             else:
-                self._board.render_drop_tiles(self._selected_piece, self._board_status)
+                return tiles
         else:
             if self._is_own_piece_selected(mx, my):
-                self._board.render_select_tile(mx, my, self._turn, self._board_status)
+                return self._board.get_select_tile(mx, my, self._turn, self._board_status)
+
+        return {}
 
 
     def _receiver(self):
-        for message in self._network.recv():
-            self._latest_message = message
-
-        if self._latest_message is not None:
-            latest_message = self._latest_message.payload
-            split = latest_message.split('#')
-
-            player = Player[split[2]]
-            
-            match split[0]:
-                case 'select':
-                    if split[1] != 'None':
-                        fields_str = split[1]
-                        fields = eval(fields_str)
-
-                        piece: Piece = Piece(
-                            Location(row = eval(fields[0])[0], col = eval(fields[0])[1]) if fields[0] != 'None' else None,
-                            PieceType[fields[1]],
-                            [Trait[trait] for trait in eval(fields[2])],
-                            eval(fields[3]),
-                            Player[fields[4]]
-                        )
-
-                        self._on_piece_select(piece, player)
-                case 'move':
-                    destination = eval(split[1])
-                    self._on_move(Location(destination[0], destination[1]), player)
-                case 'drop':
-                    destination = eval(split[1])
-                    self._on_drop(Location(destination[0], destination[1]), player)
-                case 'undo':
-                    self._on_undo(player)
-                case 'new_game':
-                    self._new_game()
-                case _:
-                    pass
+        if self._worker is None:
+            return
+
+        for payload in self._worker.receive():
+            try:
+                message = self._codec.decode_text(payload)
+            except ProtocolError:
+                self._inbound.reject()
+                continue
+
+            for ready in self._inbound.push(message):
+                self._reconcile(ready)
+
+    def _reconcile(self, message: Message):
+        match self._prediction.reconcile(message):
+            case Reconciliation.apply:
+                self._dispatch(message)
+            case Reconciliation.settled:
+                for observer in self._prediction_observers:
+                    observer.on_prediction_settled()
+            case Reconciliation.rollback:
+                for observer in self._prediction_observers:
+                    observer.on_prediction_rollback()
+                for confirmed in self._prediction.get_replay:
+                    self._dispatch(confirmed)
+                self._dispatch(message)
+            case Reconciliation.confirmed:
+                pass
+
+    def _dispatch(self, message: Message):
+        match message.opcode:
+            case Opcode.select:
+                piece = resolve_piece(message, self._state)
+                if piece is not None:
+                    self._on_piece_select(piece, message.player)
+            case Opcode.move:
+                if message.target is not None:
+                    self._on_move(message.target, message.player)
+            case Opcode.drop:
+                if message.target is not None:
+                    self._on_drop(message.target, message.player)
+            case Opcode.undo:
+                self._on_undo(message.player)
+            case Opcode.new_game:
+                self._new_game()
+            case Opcode.reject:
+                pass
 
     def _update_cursor(self, mx: int, my: int):
         if self._selected_piece is not None:
             if self._selected_piece.get_location is not None:
-                tile_width = self._board.get_tile_width
-                sel_x = self._board.get_x + self._selected_piece.get_location.col * tile_width
-                sel_y = self._board.get_x + self._selected_piece.get_location.row * tile_width
-                if self._board.mouse_on_tile(sel_x, sel_y, mx, my):
+                location = self._board.get_action_location(mx, my)
+                highlights = self._highlight_cache.get(self._state, self._legal_actions)
+                if location is not None and (
+                    location == self._selected_piece.get_location or location in highlights.destinations or location in highlights.captures
+                ):
                     pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
                     return
-                for destination in self._board.get_piece_destinations(self._selected_piece, self._board_status):
-                    x = self._board.get_x + destination.col * tile_width
-                    y = self._board.get_y + destination.row * tile_width
-                    if self._board.mouse_on_tile(x, y, mx, my):
-                        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-                        return
                 pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         else:
             if self._is_own_piece_selected(mx, my):
@@ -495,27 +526,35 @@ class PygameView(View):
                     tile_width = self._board.get_tile_width
                     piece_x = x + j * tile_width + (tile_width - width) // 2
                     piece_y = y + i * tile_width + (tile_width - width) // 2
-                    self._pieces.append(PieceView(piece_x, piece_y, width, piece))
-
-    def _render_pieces(self):
-        for piece in (self._pieces):
-            piece.render(self._screen)
+                    piece_view = PieceView(piece_x, piece_y, width, piece, self._sprites)
+                    self._pieces.append(piece_view)
+                    self._board_pieces[Location(row = i, col = j)] = piece_view
+
+    def _piece_view_at(self, mx: int, my: int) -> PieceView | None:
+        location = self._board.get_action_location(mx, my)
+        if location is not None:
+            piece_view = self._board_pieces.get(location)
+            return piece_view if piece_view is not None and piece_view.is_on_piece(mx, my) else None
+
+        for tray in self._trays:
+            piece_view = tray.piece_at(mx, my)
+            if piece_view is not None:
+                return piece_view
+        return None
 
     def _is_own_piece_selected(self, mx: int, my: int) -> bool:
-        for piece in self._pieces:
-            if piece.is_on_piece(mx, my) and piece.get_piece.get_player is self._turn and Player[f'p{self._player_id}'] is self._turn:
-                return True
-        
-        return False
+        piece = self._piece_view_at(mx, my)
+        return piece is not None and piece.get_piece.get_player is self._turn and Player[f'p{self._player_id}'] is self._turn
 
     def _select_piece(self, mx: int, my: int) -> Piece | None:
-        for piece in self._pieces:
-            if piece.is_on_piece(mx, my):
-                return piece.get_piece
+        piece = self._piece_view_at(mx, my)
+        return piece.get_piece if piece is not None else None
 
-    def _set_captured_pieces(self, x: int, y: int, width: int, captured: list[Piece]):
-        for i in range(len(captured)):
-            self._pieces.append(PieceView(x + i * self._board.get_tile_width, y, width, captured[i]))
+    def _set_captured_pieces(self, x: int, y: int, width: int, captured: tuple[Piece, ...]):
+        tile_width = self._board.get_tile_width
+        tray = [PieceView(x + i * tile_width, y, width, captured[i], self._sprites) for i in range(len(captured))]
+        self._pieces.extend(tray)
+        self._trays.append(HandTray(x, y, tile_width, width, tray))
 
     def register_new_game_observer(self, observer: NewGameObserver):
         self._new_game_observers.append(observer)
@@ -532,6 +571,12 @@ class PygameView(View):
     def register_undo_observer(self, observer: UndoObserver):
         self._undo_observers.append(observer)
 
+    def register_prediction_observer(self, observer: PredictionObserver):
+        self._prediction_observers.append(observer)
+
+    def register_wake_observer(self, observer: WakeObserver):
+        self._wake_observers.append(observer)
+
     def _new_game(self):
         for observer in self._new_game_observers:
             observer.on_new_game()
@@ -0,0 +1,77 @@
+import pytest
+
+pytest.importorskip('pygame')
+
+from conftest import BenchmarkRunner
+from controller import Controller
+from model import (Action, ActionType, ChogiBoard, ChogiPieceInfo, GameState, Location, Model, Player)
+from positions import load_position
+
+pytestmark = pytest.mark.benchmark
+
+class NoOpView:
+    def run(self):
+        pass
+
+    def on_state_change(self, state: GameState):
+        pass
+
+    def on_legal_actions_change(self, legal_actions: list[Action]):
+        pass
+
+    def register_new_game_observer(self, observer: object):
+        pass
+
+    def register_piece_select_observer(self, observer: object):
+        pass
+
+    def register_move_observer(self, observer: object):
+        pass
+
+    def register_drop_observer(self, observer: object):
+        pass
+
+    def register_undo_observer(self, observer: object):
+        pass
+
+    def register_prediction_observer(self, observer: object):
+        pass
+
+    def register_wake_observer(self, observer: object):
+        pass
+
+    def wake(self):
+        pass
+
+def _controller(model: Model) -> Controller:
+    controller = Controller(model, NoOpView())
+    controller.start()
+    return controller
+
+def test_controller_on_move(benchmark: BenchmarkRunner):
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    controller = _controller(model)
+    piece = model.piece_at(Location(6, 3))
+    assert piece is not None
+
+    def setup():
+        model.unmake()
+        controller.on_piece_select(piece, Player.p1)
+
+    controller.on_piece_select(piece, Player.p1)
+    controller.on_move(Location(5, 3), Player.p1)
+    benchmark.run('controller.on_move', lambda: controller.on_move(Location(5, 3), Player.p1), setup)
+
+def test_controller_on_drop(benchmark: BenchmarkRunner):
+    model = load_position('midgame_p1_hand')
+    controller = _controller(model)
+    drop = next(action for action in model.legal_actions() if action.action_type is ActionType.drop)
+    piece = model.state.P1_captured[0]
+
+    def setup():
+        model.unmake()
+        controller.on_piece_select(piece, Player.p1)
+
+    controller.on_piece_select(piece, Player.p1)
+    controller.on_drop(drop.target, Player.p1)
+    benchmark.run('controller.on_drop', lambda: controller.on_drop(drop.target, Player.p1), setup)
@@ -0,0 +1,73 @@
+from itertools import cycle
+import pytest
+from conftest import BenchmarkRunner
+from model import (ActionType, ChogiBoard, ChogiPieceInfo, Location, Model, Player)
+from positions import load_position
+
+pytestmark = pytest.mark.benchmark
+
+def _start() -> Model:
+    return Model(ChogiBoard(8, 8), ChogiPieceInfo())
+
+def test_piece_select(benchmark: BenchmarkRunner):
+    model = _start()
+    pieces = [model.piece_at(Location(6, 3)), model.piece_at(Location(6, 4))]
+    assert None not in pieces
+    selections = cycle(pieces)
+
+    def operation():
+        model.piece_select(next(selections), Player.p1)
+
+    version = model.state.version
+    operation()
+    operation()
+    assert model.state.version == version + 2
+
+    benchmark.run('model.piece_select', operation)
+
+def test_move(benchmark: BenchmarkRunner):
+    model = _start()
+    piece = model.piece_at(Location(6, 3))
+    assert piece is not None
+
+    def setup():
+        model.unmake()
+        model.piece_select(piece, Player.p1)
+
+    model.piece_select(piece, Player.p1)
+    model.move(Location(5, 3), Player.p1)
+    benchmark.run('model.move', lambda: model.move(Location(5, 3), Player.p1), setup)
+
+def test_drop(benchmark: BenchmarkRunner):
+    model = load_position('midgame_p1_hand')
+    drop = next(action for action in model.legal_actions() if action.action_type is ActionType.drop)
+    piece = model.state.P1_captured[0]
+
+    def setup():
+        model.unmake()
+        model.piece_select(piece, Player.p1)
+
+    model.piece_select(piece, Player.p1)
+    model.drop(drop.target, Player.p1)
+    benchmark.run('model.drop', lambda: model.drop(drop.target, Player.p1), setup)
+
+def test_undo(benchmark: BenchmarkRunner):
+    model = _start()
+    piece = model.piece_at(Location(6, 3))
+    assert piece is not None
+
+    def setup():
+        model.piece_select(piece, Player.p1)
+        model.move(Location(5, 3), Player.p1)
+
+    benchmark.run('model.undo', lambda: model.undo(Player.p1), setup)
+
+def test_new_game(benchmark: BenchmarkRunner):
+    model = _start()
+
+    benchmark.run('model.new_game', model.new_game)
+
+def test_state(benchmark: BenchmarkRunner):
+    model = load_position('midgame_many_drops')
+
+    benchmark.run('model.state', lambda: model.state)
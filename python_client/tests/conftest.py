@@ -0,0 +1,129 @@
+import json
+import os
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+import pytest
+
+BASELINE_PATH = Path(__file__).parent / 'benchmarks' / 'baseline.json'
+
+@dataclass(frozen = True)
+class BenchmarkResult:
+    name: str
+    ops_per_second: float
+    bytes_per_op: float
+
+class BenchmarkRunner:
+    def __init__(self, baseline: dict[str, dict[str, float]], tolerance: float, update: bool, min_time: float = 0.25, allocation_rounds: int = 200):
+        self._baseline = baseline
+        self._tolerance = tolerance
+        self._update = update
+        self._min_time = min_time
+        self._allocation_rounds = allocation_rounds
+        self.results: list[BenchmarkResult] = []
+
+    def run(self, name: str, operation: Callable[[], object], setup: Callable[[], object] | None = None) -> BenchmarkResult:
+        for _ in range(10):
+            if setup is not None:
+                setup()
+            operation()
+
+        elapsed = 0.0
+        count = 0
+        while elapsed < self._min_time:
+            if setup is not None:
+                setup()
+            start = perf_counter()
+            operation()
+            elapsed += perf_counter() - start
+            count += 1
+
+        allocated = 0
+        tracemalloc.start()
+        try:
+            for _ in range(self._allocation_rounds):
+                if setup is not None:
+                    setup()
+                current, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                operation()
+                _, peak = tracemalloc.get_traced_memory()
+                allocated += peak - current
+        finally:
+            tracemalloc.stop()
+
+        result = BenchmarkResult(name, count / elapsed, allocated / self._allocation_rounds)
+        self.results.append(result)
+        self._check(result)
+        return result
+
+    def _check(self, result: BenchmarkResult):
+        baseline = self._baseline.get(result.name)
+        if self._update or baseline is None:
+            return
+
+        slowest = baseline['ops_per_second'] * (1 - self._tolerance / 100)
+        if result.ops_per_second < slowest:
+            pytest.fail(
+                f'{result.name}: {result.ops_per_second:.0f} ops/sec is more than {self._tolerance:g}% '
+                f'below the baseline of {baseline["ops_per_second"]:.0f} ops/sec'
+            )
+
+        largest = baseline['bytes_per_op'] * (1 + self._tolerance / 100) + 64
+        if result.bytes_per_op > largest:
+            pytest.fail(
+                f'{result.name}: {result.bytes_per_op:.0f} bytes/op is more than {self._tolerance:g}% '
+                f'above the baseline of {baseline["bytes_per_op"]:.0f} bytes/op'
+            )
+
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup('benchmark')
+    group.addoption('--benchmark', action = 'store_true', default = False, help = 'run the benchmark suite and compare it against the stored baseline')
+    group.addoption('--benchmark-update', action = 'store_true', default = False, help = 'run the benchmark suite and overwrite the stored baseline')
+    group.addoption(
+        '--benchmark-tolerance',
+        type = float,
+        default = float(os.environ.get('CHOGI_BENCHMARK_TOLERANCE', '30')),
+        help = 'allowed regression against the baseline, in percent'
+    )
+
+def pytest_configure(config: pytest.Config):
+    config.addinivalue_line('markers', 'benchmark: throughput and allocation benchmark, only run with --benchmark')
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    if config.getoption('--benchmark') or config.getoption('--benchmark-update'):
+        return
+
+    skip = pytest.mark.skip(reason = 'benchmarks only run with --benchmark')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+@pytest.fixture(scope = 'session')
+def benchmark(pytestconfig: pytest.Config) -> Iterator[BenchmarkRunner]:
+    update = pytestconfig.getoption('--benchmark-update')
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    runner = BenchmarkRunner(baseline, pytestconfig.getoption('--benchmark-tolerance'), update)
+    pytestconfig.stash[_results_key] = runner.results
+
+    yield runner
+
+    if update:
+        baseline.update({
+            result.name: {'ops_per_second': round(result.ops_per_second), 'bytes_per_op': round(result.bytes_per_op)}
+            for result in runner.results
+        })
+        BASELINE_PATH.write_text(json.dumps(dict(sorted(baseline.items())), indent = 4) + '\n')
+
+_results_key = pytest.StashKey[list[BenchmarkResult]]()
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter, config: pytest.Config):
+    results = config.stash.get(_results_key, [])
+    if not results:
+        return
+
+    terminalreporter.section('benchmarks')
+    for result in results:
+        terminalreporter.write_line(f'{result.name:<24} {result.ops_per_second:>12.0f} ops/sec {result.bytes_per_op:>10.0f} bytes/op')
@@ -0,0 +1,22 @@
+import json
+from pathlib import Path
+from model import (Action, ActionType, ChogiBoard, ChogiPieceInfo, Location, Model, PieceType)
+
+POSITIONS: list[dict] = json.loads((Path(__file__).parent / 'fixtures' / 'perft_positions.json').read_text())
+
+def decode_action(action: list) -> Action:
+    action_type, piece_type, source, target = action
+    return Action(
+        ActionType(action_type),
+        PieceType(piece_type),
+        Location(*source) if source is not None else None,
+        Location(*target)
+    )
+
+def load_position(name: str) -> Model:
+    position = next(position for position in POSITIONS if position['name'] == name)
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    for action in position['actions']:
+        assert model.make(decode_action(action)), action
+
+    return model
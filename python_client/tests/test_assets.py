@@ -0,0 +1,50 @@
+import os
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+pytest.importorskip('pygame')
+
+from model import PieceType, Player
+from view.assets import FontRegistry, SpriteCache, TextCache
+
+def test_sprites_decode_once_and_reuse_variants():
+    cache = SpriteCache()
+    cache.set_tile_width(45)
+
+    first = cache.piece(PieceType.lion, Player.p1, 38)
+    assert cache.piece(PieceType.lion, Player.p1, 38) is first
+    assert cache.piece(PieceType.lion, Player.p2, 38) is not first
+    assert cache.tile('', 45).get_size() == (45, 45)
+    assert cache.get_loads == 2
+    assert len(cache) == 3
+
+def test_variants_invalidated_only_on_tile_width_change():
+    cache = SpriteCache()
+    cache.set_tile_width(45)
+    first = cache.tile('move', 45)
+
+    cache.set_tile_width(45)
+    assert cache.tile('move', 45) is first
+
+    cache.set_tile_width(60)
+    assert len(cache) == 0
+    assert cache.tile('move', 60).get_size() == (60, 60)
+    assert cache.get_loads == 1
+
+def test_text_surfaces_cached_with_lru_eviction():
+    pygame = pytest.importorskip('pygame')
+    pygame.font.init()
+    fonts = FontRegistry()
+    texts = TextCache(fonts, capacity = 2)
+
+    turn = texts.render('Your Turn', 'arialrounded', 28, '#F1E7D8')
+    assert texts.render('Your Turn', 'arialrounded', 28, '#F1E7D8') is turn
+    texts.render('Moves left: 2', 'arialrounded', 18, '#F1E7D8')
+    texts.render('Your Turn', 'arialrounded', 28, '#F1E7D8')
+    texts.render('Moves left: 1', 'arialrounded', 18, '#F1E7D8')
+
+    assert texts.render('Your Turn', 'arialrounded', 28, '#F1E7D8') is turn
+    assert (texts.get_hits, texts.get_misses) == (3, 3)
+    texts.render('Moves left: 2', 'arialrounded', 18, '#F1E7D8')
+    assert texts.get_misses == 4
+    assert (len(texts), len(fonts)) == (2, 2)
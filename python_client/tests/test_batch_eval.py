@@ -0,0 +1,58 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from model import (ActionType, ChogiBoard, ChogiPieceInfo, GameState, GameStatus, Location, Model, PieceType, Player, Trait)
+from model.batch_eval import PLAYER_INDEX, evaluate_batch
+from model.project_types import CHOGI_MOVES
+from positions import POSITIONS, decode_action
+
+class SparsePieceInfo:
+    def __init__(self, pieces: list[tuple[int, int, PieceType, Player]]):
+        self._pieces = pieces
+
+    def get_piece_info(self):
+        return [
+            (Location(row, col), piece_type, [Trait.protected] if piece_type is PieceType.lion else [],
+             CHOGI_MOVES[piece_type].get_moves(player), player)
+            for row, col, piece_type, player in self._pieces
+        ]
+
+def _replay() -> list[Model]:
+    models: list[Model] = []
+    for position in POSITIONS:
+        actions = position['actions']
+        for ply in range(len(actions) + 1):
+            model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+            for action in actions[:ply]:
+                assert model.make(decode_action(action))
+            models.append(model)
+    return models
+
+def _trapped() -> Model:
+    return Model(ChogiBoard(8, 8), SparsePieceInfo([
+        (0, 0, PieceType.lion, Player.p2), (0, 1, PieceType.chick, Player.p1), (1, 0, PieceType.chick, Player.p1),
+        (1, 1, PieceType.monkey, Player.p1), (0, 2, PieceType.giraffe, Player.p2), (7, 7, PieceType.lion, Player.p1)
+    ]))
+
+def test_batched_features_match_scalar_rules():
+    models = _replay() + [_trapped()]
+    states: list[GameState] = [model.state for model in models]
+    features = evaluate_batch(states)
+
+    for index, (model, state) in enumerate(zip(models, states)):
+        for player in Player:
+            assert bool(features.lion_trapped[index, PLAYER_INDEX[player]]) is model._is_checkmate(player)
+
+        if state.game_status is not GameStatus.ongoing:
+            continue
+
+        turn = PLAYER_INDEX[state.turn]
+        actions = list(model.legal_actions())
+        drop_targets = {action.target for action in actions if action.action_type is ActionType.drop}
+
+        assert features.mobility[index, turn] == sum(action.action_type is ActionType.move for action in actions)
+        assert features.drop_squares[index, turn] == len(drop_targets)
+
+    assert features.lion_trapped.any()
+    assert features.drop_squares.any()
@@ -0,0 +1,78 @@
+import random
+import pytest
+from model import (ChogiBoard, ChogiPieceInfo, Location, Model, Piece, PieceType, Player, Trait)
+from model.bitboard import Bitboard
+from model.project_types import (CHOGI_MOVES, MoveTable, chogi_move_table)
+from positions import (POSITIONS, decode_action)
+
+def _snapshot(bitboard: Bitboard) -> tuple:
+    attack_map = bitboard._attack_map
+    return (
+        {key: mask for key, mask in bitboard._masks.items() if mask},
+        dict(bitboard._occupied),
+        dict(bitboard._protected),
+        {key: list(counts) for key, counts in attack_map._counts.items()},
+        dict(attack_map._masks)
+    )
+
+def _rebuilt(table: MoveTable, pieces: dict[Location, Piece]) -> Bitboard:
+    bitboard = Bitboard(table)
+    for location, piece in pieces.items():
+        bitboard.place(location, piece)
+
+    return bitboard
+
+def _expected_attacks(table: MoveTable, pieces: dict[Location, Piece]) -> dict[tuple[Player, bool], list[int]]:
+    counts = {(player, protected): [0] * (table.get_row * table.get_col) for player in Player for protected in (True, False)}
+    for location, piece in pieces.items():
+        for target in table.destinations(piece.get_piece_type, piece.get_player, location):
+            counts[(piece.get_player, Trait.protected in piece.get_traits)][target.row * table.get_col + target.col] += 1
+
+    return counts
+
+def _piece(piece_type: PieceType, player: Player, location: Location) -> Piece:
+    traits = (Trait.protected,) if piece_type is PieceType.lion else ()
+    return Piece(location, piece_type, traits, CHOGI_MOVES[piece_type].get_moves(player), player)
+
+@pytest.mark.parametrize(('row', 'col'), [(8, 8), (5, 7)])
+def test_incremental_updates_match_a_rebuild(row: int, col: int):
+    rng = random.Random(row * col)
+    table = chogi_move_table(row, col)
+    bitboard = Bitboard(table)
+    pieces: dict[Location, Piece] = {}
+    squares = [Location(i, j) for i in range(row) for j in range(col)]
+
+    for _ in range(400):
+        empty = [location for location in squares if location not in pieces]
+        if pieces and (not empty or rng.random() < 0.45):
+            location = rng.choice(list(pieces))
+            bitboard.remove(location, pieces.pop(location))
+        else:
+            location = rng.choice(empty)
+            pieces[location] = _piece(rng.choice(list(PieceType)), rng.choice(list(Player)), location)
+            bitboard.place(location, pieces[location])
+
+        snapshot = _snapshot(bitboard)
+        assert snapshot == _snapshot(_rebuilt(table, pieces))
+
+        expected = _expected_attacks(table, pieces)
+        assert snapshot[3] == expected
+        assert snapshot[4] == {key: sum(1 << square for square, count in enumerate(counts) if count) for key, counts in expected.items()}
+
+@pytest.mark.parametrize('name', [position['name'] for position in POSITIONS if position['actions']])
+def test_model_bitboard_matches_a_rebuild_through_make_and_unmake(name: str):
+    actions = [decode_action(action) for action in next(position for position in POSITIONS if position['name'] == name)['actions']]
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    table = chogi_move_table(8, 8)
+
+    def rebuilt() -> Bitboard:
+        bitboard = Bitboard(table)
+        bitboard.load(model.state.board_status)
+        return bitboard
+
+    for action in actions:
+        assert model.make(action)
+        assert _snapshot(model._bitboard) == _snapshot(rebuilt())
+
+    while model.unmake():
+        assert _snapshot(model._bitboard) == _snapshot(rebuilt())
@@ -0,0 +1,72 @@
+import threading
+import pytest
+
+pytest.importorskip('pygame')
+
+from bot import Searcher
+from controller import BotPlayer
+from model import (ChogiBoard, ChogiPieceInfo, Location, Model, Piece, Player)
+
+class ModelDriver:
+    def __init__(self, model: Model):
+        self._model = model
+        self.bot: BotPlayer | None = None
+
+    def on_piece_select(self, piece: Piece, player: Player):
+        self._model.piece_select(piece, player)
+        self._notify()
+
+    def on_move(self, location: Location, player: Player):
+        self._model.move(location, player)
+        self._notify()
+
+    def on_drop(self, location: Location, player: Player):
+        self._model.drop(location, player)
+        self._notify()
+
+    def _notify(self):
+        if self.bot is not None:
+            self.bot.on_state_change(self._model.state)
+
+def _bot(model: Model, on_ready = None) -> BotPlayer:
+    bot = BotPlayer(model, Searcher(time_budget = 5.0, max_depth = 1), Player.p1, on_ready)
+    driver = ModelDriver(model)
+    driver.bot = bot
+    bot.register_piece_select_observer(driver)
+    bot.register_move_observer(driver)
+    bot.register_drop_observer(driver)
+    return bot
+
+def test_bot_searches_off_the_calling_thread_and_plays_on_poll():
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    ready = threading.Event()
+    bot = _bot(model, ready.set)
+    version = model.state.version
+
+    bot.on_state_change(model.state)
+    assert bot.is_thinking
+    assert model.state.version == version
+
+    assert ready.wait(5.0)
+    assert bot.poll()
+    assert model.state.moves_left == 2
+    assert model.state.turn is Player.p1
+    assert bot.is_thinking
+
+def test_stale_result_is_discarded_and_search_restarts():
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    bot = _bot(model)
+
+    bot.on_state_change(model.state)
+    chick = model.piece_at(Location(6, 0))
+    assert chick is not None
+    model.piece_select(chick, Player.p1)
+
+    assert bot.wait(5.0)
+    assert not bot.poll()
+    assert model.state.moves_left == 3
+    assert bot.is_thinking
+
+    assert bot.wait(5.0)
+    assert bot.poll()
+    assert model.state.moves_left == 2
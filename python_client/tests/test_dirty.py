@@ -0,0 +1,20 @@
+import pytest
+
+pygame = pytest.importorskip('pygame')
+
+from view.dirty import DirtyRegions
+
+def test_only_changed_regions_are_dirty():
+    regions = DirtyRegions()
+    a, b = pygame.Rect(0, 0, 10, 10), pygame.Rect(10, 0, 10, 10)
+
+    assert regions.diff({'a': (1, a), 'b': (2, b)}) == [a, b]
+    assert regions.diff({'a': (1, a), 'b': (2, b)}) == []
+    assert regions.diff({'a': (1, a), 'b': (3, b)}) == [b]
+
+def test_moved_and_removed_regions_dirty_old_rects():
+    regions = DirtyRegions()
+    a, b, c = pygame.Rect(0, 0, 10, 10), pygame.Rect(10, 0, 10, 10), pygame.Rect(20, 0, 10, 10)
+    regions.diff({'a': (1, a), 'b': (2, b)})
+
+    assert regions.diff({'a': (1, c)}) == [c, a, b]
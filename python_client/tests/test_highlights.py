@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip('pygame')
+
+from model import ActionType, Player
+from positions import load_position
+from view.highlights import HighlightCache
+
+def test_destination_and_capture_sets_built_once_per_selection():
+    model = load_position('midgame_p1_hand')
+    state = model.state
+    actions = list(model.legal_actions())
+    move = next(action for action in actions if action.action_type is ActionType.move)
+    model.piece_select(model.piece_at(move.source), state.turn)
+
+    cache = HighlightCache()
+    highlights = cache.get(model.state, actions)
+    targets = {action.target for action in actions if action.action_type is ActionType.move and action.source == move.source}
+
+    assert highlights.destinations | highlights.captures == targets
+    assert all(model.piece_at(target) is not None for target in highlights.captures)
+    assert not highlights.drops
+    assert cache.get(model.state, actions) is highlights
+    assert cache.tiles(model.state, actions) is cache.tiles(model.state, actions)
+    assert cache.get_builds == 1
+
+def test_drop_set_rebuilt_after_selection_changes():
+    model = load_position('midgame_p1_hand')
+    actions = list(model.legal_actions())
+    cache = HighlightCache()
+    assert cache.get(model.state, actions).get_tiles == {}
+
+    hand = model.state.P1_captured if model.state.turn is Player.p1 else model.state.P2_captured
+    model.piece_select(hand[0], model.state.turn)
+    highlights = cache.get(model.state, actions)
+
+    assert highlights.drops == {
+        action.target for action in actions if action.action_type is ActionType.drop and action.piece_type is hand[0].get_piece_type
+    }
+    assert set(highlights.get_tiles.values()) == {'move'}
+    assert cache.get_builds == 2
@@ -0,0 +1,30 @@
+import pytest
+
+pygame = pytest.importorskip('pygame')
+
+from model import Location
+from view.assets import SpriteCache
+from view.view import BoardView, HandTray
+
+def test_pixels_map_to_squares_arithmetically():
+    board = BoardView(8, 8, SpriteCache())
+    board.render_board(pygame.Surface((720, 720)), 180, 180, 45)
+
+    assert board.get_action_location(180, 180) == Location(row = 0, col = 0)
+    assert board.get_action_location(539, 539) == Location(row = 7, col = 7)
+    assert board.get_action_location(226, 314) == Location(row = 2, col = 1)
+    assert board.get_action_location(179, 200) is None
+    assert board.get_action_location(540, 200) is None
+    assert not board.mouse_on_board(200, 540)
+
+def test_hand_tray_indexes_slots_and_skips_gaps():
+    pieces = [object(), object(), object()]
+    tray = HandTray(100, 50, 45, 38, pieces)
+
+    assert tray.piece_at(100, 50) is pieces[0]
+    assert tray.piece_at(145 + 37, 87) is pieces[1]
+    assert tray.piece_at(145 + 38, 60) is None
+    assert tray.piece_at(190 + 10, 60) is pieces[2]
+    assert tray.piece_at(235 + 10, 60) is None
+    assert tray.piece_at(99, 60) is None
+    assert tray.piece_at(110, 88) is None
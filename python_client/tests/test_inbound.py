@@ -0,0 +1,64 @@
+from model import Player
+from network import (InboundQueue, Message, Opcode, SEQUENCE_MODULUS)
+
+def _message(player: Player, sequence: int) -> Message:
+    return Message(Opcode.undo, player, sequence = sequence)
+
+def test_applies_in_order_once():
+    inbound = InboundQueue()
+
+    assert inbound.push(_message(Player.p1, 0)) == [_message(Player.p1, 0)]
+    assert inbound.push(_message(Player.p1, 0)) == []
+    assert inbound.push(_message(Player.p2, 0)) == [_message(Player.p2, 0)]
+    assert inbound.push(_message(Player.p1, 1)) == [_message(Player.p1, 1)]
+
+    assert (inbound.get_received, inbound.get_applied, inbound.get_dropped) == (4, 3, 1)
+
+def test_holds_back_until_gap_fills():
+    inbound = InboundQueue()
+
+    assert inbound.push(_message(Player.p1, 0)) == [_message(Player.p1, 0)]
+    assert inbound.push(_message(Player.p1, 3)) == []
+    assert inbound.push(_message(Player.p1, 2)) == []
+    assert inbound.push(_message(Player.p1, 3)) == []
+    assert inbound.push(_message(Player.p1, 1)) == [_message(Player.p1, sequence) for sequence in range(1, 4)]
+
+    assert inbound.get_gaps == 1
+    assert inbound.get_dropped == 1
+    assert inbound.get_pending == 0
+
+def test_first_message_from_each_sender_sets_the_expected_sequence():
+    inbound = InboundQueue()
+
+    assert inbound.push(_message(Player.p2, 5)) == [_message(Player.p2, 5)]
+    assert inbound.push(_message(Player.p2, 6)) == [_message(Player.p2, 6)]
+    assert inbound.push(_message(Player.p2, 4)) == []
+    assert inbound.push(_message(Player.p1, 0)) == [_message(Player.p1, 0)]
+
+    assert (inbound.get_gaps, inbound.get_dropped, inbound.get_pending) == (0, 1, 0)
+
+def test_skips_missing_messages_when_backlog_is_full():
+    inbound = InboundQueue(max_pending = 2)
+
+    assert inbound.push(_message(Player.p1, 0)) == [_message(Player.p1, 0)]
+    assert inbound.push(_message(Player.p1, 2)) == []
+    assert inbound.push(_message(Player.p1, 3)) == []
+    assert inbound.push(_message(Player.p1, 4)) == [_message(Player.p1, sequence) for sequence in range(2, 5)]
+    assert inbound.push(_message(Player.p1, 1)) == []
+
+    assert inbound.get_skipped == 1
+    assert inbound.get_dropped == 1
+
+def test_sequence_wraps_around():
+    inbound = InboundQueue()
+    for sequence in range(SEQUENCE_MODULUS):
+        inbound.push(_message(Player.p1, sequence))
+
+    assert inbound.push(_message(Player.p1, 0)) == [_message(Player.p1, 0)]
+    assert inbound.push(_message(Player.p1, SEQUENCE_MODULUS - 1)) == []
+
+def test_rejected_messages_count_as_dropped():
+    inbound = InboundQueue()
+    inbound.reject()
+
+    assert (inbound.get_received, inbound.get_applied, inbound.get_dropped) == (1, 0, 1)
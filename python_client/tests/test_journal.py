@@ -0,0 +1,64 @@
+import pytest
+from model import (ChogiBoard, ChogiPieceInfo, Model, Player)
+from model.journal import Journal
+from positions import (POSITIONS, decode_action)
+
+ACTIONS = [decode_action(action) for action in next(position for position in POSITIONS if position['name'] == 'opening')['actions']]
+
+def _played(plies: int, history_limit: int = 1024) -> Model:
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo(), history_limit)
+    for action in ACTIONS[:plies]:
+        assert model.make(action)
+
+    return model
+
+def test_journal_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        Journal(0)
+
+    with pytest.raises(ValueError):
+        Model(ChogiBoard(8, 8), ChogiPieceInfo(), 0)
+
+def test_history_limit_evicts_the_oldest_actions():
+    model = _played(5, history_limit = 3)
+    reference = _played(2)
+
+    for _ in range(3):
+        assert model.unmake()
+
+    assert not model.unmake()
+    assert model.state.board_status == reference.state.board_status
+    assert (model.state.turn, model.state.moves_left) == (reference.state.turn, reference.state.moves_left)
+    assert model.position_hash == reference.position_hash
+
+    for _ in range(3):
+        assert model.redo()
+
+    assert not model.redo()
+    assert model.position_hash == _played(5).position_hash
+
+def test_unmake_and_redo_on_an_empty_journal():
+    model = _played(0)
+    position_hash = model.position_hash
+
+    assert not model.unmake()
+    assert not model.redo()
+    model.undo(Player.p1)
+    assert model.position_hash == position_hash
+
+def test_make_invalidates_redo():
+    model = _played(2)
+    assert model.unmake()
+    assert model.can_redo
+
+    assert model.make(next(action for action in model.legal_actions() if action != ACTIONS[1]))
+    assert not model.can_redo
+    assert not model.redo()
+
+def test_new_game_clears_the_journal():
+    model = _played(3)
+    assert model.unmake()
+
+    model.new_game()
+    assert not model.can_redo
+    assert not model.unmake()
@@ -0,0 +1,49 @@
+import pytest
+from model import (Location, PieceType, Player)
+from model.project_types import (CHOGI_MOVES, chogi_move_table)
+
+def _baseline(piece_type: PieceType, player: Player, location: Location, row: int, col: int) -> set[Location]:
+    targets = {Location(location.row - delta_y, location.col + delta_x) for delta_x, delta_y in CHOGI_MOVES[piece_type].get_moves(player)}
+    return {target for target in targets if 0 <= target.row < row and 0 <= target.col < col}
+
+@pytest.mark.parametrize(('row', 'col'), [(5, 7), (7, 5), (1, 4), (3, 3)])
+def test_move_table_matches_baseline_offsets(row: int, col: int):
+    table = chogi_move_table(row, col)
+    assert (table.get_row, table.get_col) == (row, col)
+
+    for piece_type in PieceType:
+        for player in Player:
+            masks = table.masks(piece_type, player)
+            assert len(masks) == row * col
+
+            for square in range(row * col):
+                location = table.location(square)
+                assert location == Location(square // col, square % col)
+
+                destinations = table.destinations(piece_type, player, location)
+                assert len(destinations) == len(set(destinations))
+                assert set(destinations) == _baseline(piece_type, player, location, row, col)
+                assert masks[square] == sum(1 << (target.row * col + target.col) for target in destinations)
+
+def test_edges_and_corners_per_orientation():
+    table = chogi_move_table(5, 7)
+
+    assert table.destinations(PieceType.chick, Player.p1, Location(0, 3)) == ()
+    assert table.destinations(PieceType.chick, Player.p1, Location(4, 6)) == (Location(3, 6),)
+    assert table.destinations(PieceType.chick, Player.p2, Location(4, 0)) == ()
+    assert table.destinations(PieceType.chick, Player.p2, Location(0, 6)) == (Location(1, 6),)
+
+    corners = [Location(0, 0), Location(0, 6), Location(4, 0), Location(4, 6)]
+    for player in Player:
+        for corner in corners:
+            assert len(table.destinations(PieceType.lion, player, corner)) == 3
+            assert len(table.destinations(PieceType.elephant, player, corner)) == 1
+            assert len(table.destinations(PieceType.giraffe, player, corner)) == 2
+
+        assert len(table.destinations(PieceType.monkey, player, Location(0, 3))) == 5
+        assert len(table.destinations(PieceType.monkey, player, Location(2, 6))) == 5
+        assert len(table.destinations(PieceType.monkey, player, Location(2, 3))) == 8
+
+def test_move_tables_are_shared_per_size():
+    assert chogi_move_table(5, 7) is chogi_move_table(5, 7)
+    assert chogi_move_table(5, 7) is not chogi_move_table(7, 5)
@@ -0,0 +1,62 @@
+import threading
+import time
+from dataclasses import dataclass
+from network import NetworkWorker
+
+@dataclass(frozen = True)
+class FakeMessage:
+    payload: str
+
+class FakeConnection:
+    def __init__(self):
+        self.sent: list[str] = []
+        self.incoming: list[str] = []
+        self._lock = threading.Lock()
+
+    def send(self, payload: str):
+        with self._lock:
+            self.sent.append(payload)
+
+    def recv(self) -> list[FakeMessage]:
+        with self._lock:
+            incoming, self.incoming = self.incoming, []
+        return [FakeMessage(payload) for payload in incoming]
+
+    def deliver(self, payload: str):
+        with self._lock:
+            self.incoming.append(payload)
+
+def test_sends_and_receives_off_the_calling_thread():
+    connection = FakeConnection()
+    arrived = threading.Event()
+    worker = NetworkWorker(connection, arrived.set)
+    worker.start()
+
+    try:
+        worker.send('first')
+        worker.send('second')
+        connection.deliver('reply')
+
+        assert arrived.wait(1.0)
+        assert worker.receive() == ['reply']
+        assert worker.receive() == []
+    finally:
+        worker.stop()
+
+    assert connection.sent == ['first', 'second']
+    assert not worker.is_running
+    assert worker.get_error is None
+
+def test_records_connection_errors():
+    class BrokenConnection(FakeConnection):
+        def recv(self) -> list[FakeMessage]:
+            raise ConnectionError('closed')
+
+    worker = NetworkWorker(BrokenConnection())
+    worker.start()
+    deadline = time.monotonic() + 1.0
+    while worker.is_running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    worker.stop()
+
+    assert isinstance(worker.get_error, ConnectionError)
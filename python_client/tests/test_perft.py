@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from time import perf_counter
+import pytest
+from model import ActionType
+from model.perft import divide, perft
+from positions import POSITIONS, load_position
+
+@pytest.mark.parametrize(
+    ('name', 'depth', 'expected'),
+    [
+        (position['name'], depth, count)
+        for position in POSITIONS
+        for depth, count in enumerate(position['counts'], start = 1)
+    ]
+)
+def test_perft(name: str, depth: int, expected: int, record_property: Callable[[str, object], None]):
+    model = load_position(name)
+    state = model.state
+    position_hash = model.position_hash
+
+    start = perf_counter()
+    nodes = perft(model, depth)
+    elapsed = perf_counter() - start
+
+    record_property('nodes', nodes)
+    record_property('nodes_per_second', round(nodes / elapsed) if elapsed > 0 else 0)
+
+    assert nodes == expected
+    assert model.state.change_to({'version': state.version}) == state
+    assert model.position_hash == position_hash
+
+def test_positions_include_drops():
+    assert any(
+        action[0] == ActionType.drop
+        for position in POSITIONS
+        for action in position['actions']
+    )
+
+@pytest.mark.parametrize('position', POSITIONS, ids = [position['name'] for position in POSITIONS])
+def test_divide_matches_perft(position: dict):
+    model = load_position(position['name'])
+    depth = min(2, len(position['counts']))
+
+    counts = divide(model, depth)
+
+    assert len(counts) == position['counts'][0]
+    assert sum(counts.values()) == position['counts'][depth - 1]
@@ -0,0 +1,23 @@
+import pickle
+from model import ChogiBoard, ChogiPieceInfo, Model, Player
+
+def test_pickled_pieces_keep_interned_kinds():
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    pieces = [piece for row in model.state.board_status for piece in row if piece is not None]
+
+    restored = pickle.loads(pickle.dumps(pieces))
+
+    assert restored == pieces
+    assert all(copy.get_kind is piece.get_kind for copy, piece in zip(restored, pieces))
+    assert {hash(copy) for copy in restored} == {hash(piece) for piece in pieces}
+
+def test_pickled_state_compares_equal_to_the_original():
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    captured = model.state.board_status[0][0]
+    assert captured is not None
+
+    kind = captured.captured_by(Player.p1).get_kind
+    restored = pickle.loads(pickle.dumps(model.state))
+
+    assert restored.board_status == model.state.board_status
+    assert pickle.loads(pickle.dumps(kind)) is kind
@@ -0,0 +1,126 @@
+import pytest
+from model import (ActionType, ChogiBoard, ChogiPieceInfo, Location, Model, Player)
+from model.zobrist import ZobristKeys
+from network import (Message, MessageCodec, Opcode, PredictionBuffer, Reconciliation, select_message)
+from positions import load_position
+
+class EchoWorker:
+    def __init__(self):
+        self.sent: list[str] = []
+        self.inbox: list[str] = []
+
+    def send(self, payload: str):
+        self.sent.append(payload)
+
+    def receive(self) -> list[str]:
+        payloads, self.inbox = self.inbox, []
+        return payloads
+
+def test_rollback_restores_the_savepoint():
+    model = load_position('midgame_p1_hand')
+    state = model.state
+    position_hash = model.position_hash
+    legal_actions = list(model.legal_actions())
+    savepoint = model.savepoint()
+
+    drop = next(action for action in legal_actions if action.action_type is ActionType.drop)
+    assert model.make(drop)
+    assert model.make(next(model.legal_actions()))
+    model.undo(Player.p1)
+    piece = next(piece for row in model.state.board_status for piece in row if piece is not None and piece.get_player is model.state.turn)
+    model.piece_select(piece, model.state.turn)
+
+    model.rollback(savepoint)
+
+    assert model.state.version > state.version
+    assert model.state.change_to({'version': state.version}) == state
+    assert model.position_hash == position_hash
+    assert model.position_hash == ZobristKeys(8, 8, 3).hash_state(model.state)
+    assert list(model.legal_actions()) == legal_actions
+
+def test_rollback_restores_undo_history():
+    model = load_position('opening')
+    chick = model.piece_at(Location(6, 1))
+    assert chick is not None
+
+    model.piece_select(chick, model.state.turn)
+    model.move(Location(5, 1), model.state.turn)
+    savepoint = model.savepoint()
+    state = model.state
+
+    model.undo(Player.p1)
+    assert model.state.board_status != state.board_status
+
+    model.rollback(savepoint)
+    model.undo(Player.p1)
+    assert model.state.board_status[6][1] == chick
+
+def test_confirmed_predictions_settle():
+    buffer = PredictionBuffer()
+    first = Message(Opcode.move, Player.p1, target = Location(5, 1), sequence = 0)
+    second = Message(Opcode.undo, Player.p1, sequence = 1)
+
+    assert buffer.predict(first)
+    assert not buffer.predict(second)
+    assert buffer.reconcile(first) is Reconciliation.confirmed
+    assert buffer.reconcile(second) is Reconciliation.settled
+    assert buffer.reconcile(Message(Opcode.undo, Player.p2)) is Reconciliation.apply
+    assert buffer.get_confirmed == 2
+
+def test_foreign_message_triggers_rollback():
+    buffer = PredictionBuffer()
+    buffer.predict(Message(Opcode.move, Player.p1, target = Location(5, 1), sequence = 3))
+
+    assert buffer.reconcile(Message(Opcode.undo, Player.p2, sequence = 7)) is Reconciliation.rollback
+    assert len(buffer) == 0
+    assert buffer.get_rollbacks == 1
+
+def test_rollback_replays_confirmed_predictions():
+    buffer = PredictionBuffer()
+    select = Message(Opcode.select, Player.p1, source = Location(6, 3), sequence = 0)
+    move = Message(Opcode.move, Player.p1, target = Location(5, 3), sequence = 1)
+    foreign = Message(Opcode.select, Player.p2, source = Location(1, 3), sequence = 0)
+
+    buffer.predict(select)
+    buffer.predict(move)
+
+    assert buffer.reconcile(select) is Reconciliation.confirmed
+    assert buffer.reconcile(foreign) is Reconciliation.rollback
+    assert buffer.get_replay == (select,)
+    assert buffer.reconcile(move) is Reconciliation.apply
+
+def test_foreign_message_between_own_echoes_keeps_confirmed_actions():
+    pytest.importorskip('pygame')
+    from controller import Controller
+    from view import PygameView
+
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    view = PygameView(model.state, networked = False)
+    controller = Controller(model, view)
+    controller.register_game_state_change_observer(view)
+    view.register_piece_select_observer(controller)
+    view.register_move_observer(controller)
+    view.register_prediction_observer(controller)
+
+    worker = EchoWorker()
+    view._worker = worker
+    chick = model.piece_at(Location(6, 3))
+    opponent = model.piece_at(Location(1, 3))
+    assert chick is not None and opponent is not None
+
+    view._send(select_message(chick, Player.p1))
+    view._send(Message(Opcode.move, Player.p1, target = Location(5, 3)))
+    assert model.state.board_status[5][3] is not None
+
+    codec = MessageCodec(8, 8)
+    own_select, own_move = worker.sent
+    worker.inbox = [own_select, codec.encode_text(select_message(opponent, Player.p2)), own_move]
+    view._receiver()
+
+    authoritative = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    authoritative.piece_select(chick, Player.p1)
+    authoritative.move(Location(5, 3), Player.p1)
+
+    assert model.state.moves_left == 2
+    assert model.state.board_status == authoritative.state.board_status
+    assert model.position_hash == authoritative.position_hash
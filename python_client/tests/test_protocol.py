@@ -0,0 +1,56 @@
+import base64
+import pytest
+from model import (ChogiBoard, ChogiPieceInfo, Location, Model, PieceType, Player)
+from network import (MessageCodec, Message, Opcode, ProtocolError, SEQUENCE_MODULUS, select_message, resolve_piece)
+from positions import load_position
+
+CODEC = MessageCodec(8, 8)
+
+@pytest.mark.parametrize('message', [
+    Message(Opcode.select, Player.p1, PieceType.chick, Location(6, 1)),
+    Message(Opcode.select, Player.p2, PieceType.monkey, None),
+    Message(Opcode.move, Player.p1, target = Location(5, 1)),
+    Message(Opcode.drop, Player.p2, target = Location(0, 7)),
+    Message(Opcode.undo, Player.p1),
+    Message(Opcode.new_game, Player.p2, sequence = 65535)
+])
+def test_round_trip(message: Message):
+    text = CODEC.encode_text(message)
+
+    assert CODEC.decode(CODEC.encode(message)) == message
+    assert CODEC.decode_text(text) == message
+    assert len(text) <= 16
+
+def _text(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii')
+
+@pytest.mark.parametrize('text', [
+    '',
+    'not base64!',
+    _text(bytes([2, 1, 1, 1, 0, 0xFF])),
+    _text(bytes([2, 1, 1, 1, 0, 0xFF, 0, 0, 0])),
+    _text(bytes([1, 1, 1, 1, 0, 0xFF, 0, 0])),
+    _text(bytes([2, 9, 1, 1, 0, 0xFF, 0, 0])),
+    _text(bytes([2, 1, 3, 1, 0, 0xFF, 0, 0])),
+    _text(bytes([2, 1, 1, 9, 0, 0xFF, 0, 0])),
+    _text(bytes([2, 1, 1, 1, 64, 0xFF, 0, 0]))
+])
+def test_rejects_malformed_messages(text: str):
+    with pytest.raises(ProtocolError):
+        CODEC.decode_text(text)
+
+def test_sequence_numbers_wrap():
+    message = Message(Opcode.undo, Player.p1, sequence = SEQUENCE_MODULUS + 5)
+
+    assert CODEC.decode(CODEC.encode(message)).sequence == 5
+
+def test_resolves_board_and_hand_pieces():
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    piece = model.piece_at(Location(6, 1))
+    assert piece is not None
+    assert resolve_piece(select_message(piece, Player.p1), model.state) == piece
+
+    model = load_position('midgame_p1_hand')
+    captured = model.state.P1_captured[0]
+    assert resolve_piece(select_message(captured, Player.p1), model.state) == captured
+    assert resolve_piece(Message(Opcode.select, Player.p2, captured.get_piece_type), model.state) is None
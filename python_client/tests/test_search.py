@@ -0,0 +1,127 @@
+import random
+import pytest
+from model import (Action, ActionType, Bound, ChogiBoard, ChogiPieceInfo, GameState, GameStatus, Location, Model, PieceType,
+                   TranspositionTable)
+from bot import (MaterialEvaluation, Searcher, WIN_SCORE)
+from positions import (POSITIONS, load_position)
+
+class SideToMove:
+    def evaluate(self, state: GameState) -> float:
+        return 1.0
+
+def _minimax(model: Model, depth: int, evaluation: MaterialEvaluation, ply: int = 0) -> float:
+    state = model.state
+    if state.game_status is GameStatus.has_winner:
+        return WIN_SCORE - ply
+    if state.game_status is GameStatus.draw:
+        return 0.0
+    if depth <= 0:
+        return evaluation.evaluate(state)
+
+    actions = list(model.legal_actions())
+    if not actions:
+        return evaluation.evaluate(state)
+
+    best = -float('inf')
+    for action in actions:
+        model.make(action)
+        value = _minimax(model, depth - 1, evaluation, ply + 1)
+        if model.state.turn is not state.turn:
+            value = -value
+        model.unmake()
+        best = max(best, value)
+    return best
+
+def _searcher(depth: int, evaluation: object = None, table: TranspositionTable | None = None) -> Searcher:
+    return Searcher(evaluation or MaterialEvaluation(), time_budget = 600.0, max_depth = depth, table = table)
+
+def _random_game(seed: int, plies: int) -> Model:
+    rng = random.Random(seed)
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    for _ in range(plies):
+        assert model.make(rng.choice(list(model.legal_actions())))
+
+    return model
+
+def test_score_negated_only_when_turn_changes():
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    assert model.state.moves_left > 1
+    assert _searcher(1, SideToMove()).search(model).value == 1.0
+
+    while model.state.moves_left > 1:
+        assert model.make(next(model.legal_actions()))
+    assert _searcher(1, SideToMove()).search(model).value == -1.0
+
+def test_search_leaves_the_live_model_untouched():
+    model = load_position('opening')
+    assert model.unmake()
+    state, position_hash = model.state, model.position_hash
+
+    result = _searcher(2).search(model)
+
+    assert result.action is not None and result.nodes > 0
+    assert model.state is state
+    assert model.position_hash == position_hash
+    assert model.can_redo
+
+@pytest.mark.parametrize('name', ['opening', 'midgame_p1_hand'])
+def test_alpha_beta_with_table_matches_minimax(name: str):
+    model = load_position(name)
+    expected = _minimax(model, 2, MaterialEvaluation())
+    searcher = _searcher(2)
+
+    assert searcher.search(model).value == expected
+    assert searcher.search(model).value == expected
+    assert searcher.get_table.get_hits > 0
+
+def test_bounds_from_table_only_narrow_the_window():
+    model = load_position('midgame_p1_hand')
+    expected = _minimax(model, 2, MaterialEvaluation())
+    table = TranspositionTable()
+
+    for action in list(model.legal_actions()):
+        model.make(action)
+        table.store(model.position_hash, 64, 10 * WIN_SCORE, Bound.upper)
+        model.unmake()
+
+    assert _searcher(2, table = table).search(model).value == expected
+
+    for action in list(model.legal_actions()):
+        model.make(action)
+        table.store(model.position_hash, 64, -10 * WIN_SCORE, Bound.lower)
+        model.unmake()
+
+    assert _searcher(2, table = table).search(model).value == expected
+
+@pytest.mark.parametrize('name', [position['name'] for position in POSITIONS])
+def test_make_accepts_exactly_the_legal_actions(name: str):
+    model = load_position(name)
+    legal = set(model.legal_actions())
+    position_hash = model.position_hash
+    squares = [Location(row, col) for row in range(8) for col in range(8)]
+
+    candidates = {Action(ActionType.drop, piece_type, None, target) for piece_type in PieceType for target in squares}
+    for source in squares:
+        piece = model.piece_at(source)
+        if piece is not None:
+            candidates |= {Action(ActionType.move, piece.get_piece_type, source, target) for target in squares}
+
+    assert legal <= candidates
+    for action in candidates:
+        assert model.make(action) == (action in legal), action
+        if action in legal:
+            assert model.unmake()
+        assert model.position_hash == position_hash
+
+def test_win_scores_count_plies_to_the_win():
+    model = _random_game(0, 159)
+    expected = _minimax(model, 2, MaterialEvaluation())
+    assert expected == WIN_SCORE - 2
+
+    searcher = _searcher(4)
+    result = searcher.search(model)
+    assert (result.value, result.depth) == (expected, 2)
+    assert searcher.search(model).value == expected
+
+    assert result.action is not None and model.make(result.action)
+    assert _searcher(4).search(model).value == WIN_SCORE - 1
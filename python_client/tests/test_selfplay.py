@@ -0,0 +1,38 @@
+from dataclasses import replace
+import pytest
+from model import GameStatus
+from selfplay import play_game, run_selfplay
+
+def test_play_game_is_deterministic_for_a_seed():
+    first = play_game(7, 'capture', 'random', 120)
+
+    assert play_game(7, 'capture', 'random', 120) == first
+    assert 0 < first.plies <= 120
+    assert (first.winner is not None) is (first.status is GameStatus.has_winner)
+
+def test_run_selfplay_is_deterministic_for_a_seed():
+    first = run_selfplay(2, 'capture', 'random', max_plies = 60, workers = 1, seed = 3, chunk_size = 1)
+    second = run_selfplay(2, 'capture', 'random', max_plies = 60, workers = 1, seed = 3, chunk_size = 1)
+
+    assert replace(first, elapsed = 0.0) == replace(second, elapsed = 0.0)
+    assert first.games == 2
+    assert first.p1_wins + first.p2_wins + first.draws + first.unfinished == 2
+    assert first.total_plies == sum(play_game(seed, 'capture', 'random', 60).plies for seed in (3, 4))
+
+def test_run_selfplay_uses_the_board_size():
+    square = run_selfplay(1, 'capture', 'capture', max_plies = 60, workers = 1, seed = 183)
+    wide = run_selfplay(1, 'capture', 'capture', max_plies = 60, workers = 1, seed = 183, col = 9)
+
+    assert (square.p2_wins, square.total_plies) == (1, play_game(183, 'capture', 'capture', 60).plies)
+    assert (wide.unfinished, wide.total_plies) == (1, play_game(183, 'capture', 'capture', 60, 8, 9).plies)
+
+@pytest.mark.parametrize(
+    'arguments',
+    [
+        {'games': 0}, {'games': -1}, {'chunk_size': 0}, {'max_plies': -1}, {'workers': 0}, {'p1_policy': 'unknown'},
+        {'row': 7}, {'col': 6}
+    ]
+)
+def test_run_selfplay_rejects_invalid_arguments(arguments: dict[str, object]):
+    with pytest.raises(ValueError):
+        run_selfplay(**{'games': 1, **arguments})
@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+
+pytest.importorskip('websockets')
+
+from websockets.asyncio.client import connect
+from model import (Location, PieceType, Player)
+from network import (MessageCodec, Message, Opcode, select_message)
+from server import (GameServer, Match)
+
+CODEC = MessageCodec(8, 8)
+
+def test_match_rejects_illegal_and_spoofed_actions():
+    match = Match(1)
+    chick = match.get_model.piece_at(Location(6, 0))
+    assert chick is not None
+
+    select = CODEC.encode_text(select_message(chick, Player.p1, sequence = 0))
+    assert match.apply(Player.p1, select) == select
+
+    spoofed = CODEC.encode_text(Message(Opcode.move, Player.p1, target = Location(5, 0), sequence = 1))
+    rejected = match.apply(Player.p2, spoofed)
+    assert rejected is not None
+    assert CODEC.decode_text(rejected) == Message(Opcode.reject, Player.p2, sequence = 1)
+
+    stray = CODEC.encode_text(Message(Opcode.drop, Player.p1, target = Location(3, 0), sequence = 1))
+    assert match.apply(Player.p1, stray) == stray
+    assert match.get_model.state.selected_piece is None
+
+    unselected = CODEC.encode_text(Message(Opcode.move, Player.p1, target = Location(5, 0), sequence = 2))
+    assert CODEC.decode_text(match.apply(Player.p1, unselected) or '').opcode is Opcode.reject
+
+    assert match.apply(Player.p1, 'garbage') is None
+    assert (match.get_accepted, match.get_rejected, match.get_malformed) == (2, 2, 1)
+
+def test_match_stamps_spoofed_reject_with_connection_player():
+    match = Match(1)
+    model = match.get_model
+    chick = model.piece_at(Location(6, 0))
+    assert chick is not None
+
+    version = model.state.version
+    spoofed = CODEC.encode_text(select_message(chick, Player.p1, sequence = 4))
+    rejected = match.apply(Player.p2, spoofed)
+
+    assert rejected is not None
+    assert CODEC.decode_text(rejected) == Message(Opcode.reject, Player.p2, sequence = 4)
+    assert model.state.selected_piece is None
+    assert model.state.version == version
+
+def test_match_broadcasts_deselect_for_failed_move():
+    match = Match(1)
+    model = match.get_model
+    lion = next(piece for row in model.state.board_status for piece in row if piece is not None
+                and piece.get_piece_type is PieceType.lion and piece.get_player is Player.p1)
+    assert lion.get_location is not None
+
+    select = CODEC.encode_text(select_message(lion, Player.p1, sequence = 0))
+    assert match.apply(Player.p1, select) == select
+    assert model.state.selected_piece == lion
+
+    blocked = CODEC.encode_text(Message(Opcode.move, Player.p1, target = lion.get_location, sequence = 1))
+    assert match.apply(Player.p1, blocked) == blocked
+    assert model.state.selected_piece is None
+    assert model.state.turn is Player.p1
+
+async def _play() -> tuple[list[str], list[str], int]:
+    server = GameServer('127.0.0.1', 0)
+    task = asyncio.create_task(server.serve_forever())
+    port = await server.wait_started()
+
+    try:
+        async with connect(f'ws://127.0.0.1:{port}') as first, connect(f'ws://127.0.0.1:{port}') as second, \
+                connect(f'ws://127.0.0.1:{port}') as third:
+            handshakes = [await asyncio.wait_for(connection.recv(), 1.0) for connection in (first, second, third)]
+
+            await first.send(CODEC.encode_text(Message(Opcode.select, Player.p1, PieceType.chick, Location(6, 0), sequence = 0)))
+            await first.send(CODEC.encode_text(Message(Opcode.move, Player.p1, target = Location(5, 0), sequence = 1)))
+            await second.send(CODEC.encode_text(Message(Opcode.undo, Player.p2, sequence = 0)))
+
+            received = [await asyncio.wait_for(second.recv(), 1.0) for _ in range(3)]
+            return handshakes, received, len(server.get_matches)
+    finally:
+        server.close()
+        await asyncio.wait_for(task, 5.0)
+
+def test_server_pairs_clients_and_fans_out_validated_actions():
+    handshakes, received, matches = asyncio.run(_play())
+
+    assert handshakes == ['1 ', '2 ', '1 ']
+    assert matches == 2
+
+    messages = [(text.split(' ', 1)[0], CODEC.decode_text(text.split(' ', 1)[1])) for text in received]
+    assert [(sender, message.opcode) for sender, message in messages] == [('1', Opcode.select), ('1', Opcode.move), ('2', Opcode.reject)]
@@ -0,0 +1,83 @@
+import pytest
+from model import (Action, ActionType, Bound, ChogiBoard, ChogiPieceInfo, Location, Model, PieceType, Replacement,
+                   TableEntry, TranspositionTable)
+from model.zobrist import ZobristKeys
+from positions import (POSITIONS, decode_action)
+
+ACTION = Action(ActionType.move, PieceType.chick, Location(6, 0), Location(5, 0))
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        TranspositionTable(0)
+
+def test_probe_returns_stored_bounds():
+    table = TranspositionTable(8)
+    table.store(3, 2, 1.5, Bound.lower, ACTION)
+    table.store(4, 1, -2.0, Bound.upper)
+
+    assert table.probe(3) == TableEntry(3, 2, 1.5, Bound.lower, ACTION)
+    assert table.probe(4) == TableEntry(4, 1, -2.0, Bound.upper, None)
+    assert table.probe(11) is None
+    assert table.probe(5) is None
+    assert (table.get_hits, table.get_misses) == (2, 2)
+
+    table.store(3, 1, 0.5, Bound.exact)
+    assert table.probe(3) == TableEntry(3, 1, 0.5, Bound.exact, None)
+
+def test_depth_preferred_keeps_the_deeper_entry_on_collision():
+    table = TranspositionTable(4, Replacement.depth_preferred)
+    table.store(1, 5, 1.0, Bound.exact)
+
+    table.store(5, 3, 2.0, Bound.exact)
+    assert table.probe(5) is None
+    assert table.probe(1) == TableEntry(1, 5, 1.0, Bound.exact, None)
+
+    table.store(5, 5, 3.0, Bound.lower)
+    assert table.probe(1) is None
+    assert table.probe(5) == TableEntry(5, 5, 3.0, Bound.lower, None)
+    assert len(table) == 1
+
+def test_always_replace_overwrites_on_collision():
+    table = TranspositionTable(4, Replacement.always_replace)
+    table.store(1, 5, 1.0, Bound.exact)
+    table.store(5, 0, 2.0, Bound.upper)
+
+    assert table.probe(1) is None
+    assert table.probe(5) == TableEntry(5, 0, 2.0, Bound.upper, None)
+    assert len(table) == 1
+
+@pytest.mark.parametrize('replacement', list(Replacement))
+def test_size_is_bounded_by_capacity(replacement: Replacement):
+    table = TranspositionTable(8, replacement)
+    for key in range(100):
+        table.store(key, key % 3, float(key), Bound.exact)
+
+    assert len(table) == table.get_capacity == 8
+
+    table.clear()
+    assert len(table) == 0
+    assert (table.get_hits, table.get_misses) == (0, 0)
+    assert all(table.probe(key) is None for key in range(100))
+
+@pytest.mark.parametrize('name', [position['name'] for position in POSITIONS if position['actions']])
+def test_incremental_hash_matches_full_hash(name: str):
+    actions = [decode_action(action) for action in next(position for position in POSITIONS if position['name'] == name)['actions']]
+    model = Model(ChogiBoard(8, 8), ChogiPieceInfo())
+    keys = ZobristKeys(8, 8, model.state.moves_left)
+    hashes = [model.position_hash]
+    assert model.position_hash == keys.hash_state(model.state)
+
+    for action in actions:
+        assert model.make(action)
+        assert model.position_hash == keys.hash_state(model.state)
+        hashes.append(model.position_hash)
+
+    for expected in reversed(hashes[:-1]):
+        assert model.unmake()
+        assert model.position_hash == keys.hash_state(model.state) == expected
+
+    for expected in hashes[1:]:
+        assert model.redo()
+        assert model.position_hash == keys.hash_state(model.state) == expected
+
+    assert not model.redo()